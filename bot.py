@@ -31,7 +31,7 @@ from config.settings import (
     TARGET_USER_ID,
     validate_settings,
 )
-from utils.constants import ERROR_MESSAGE_LIFETIME
+from utils.constants import ERROR_MESSAGE_LIFETIME, SPRITE_PREWARM_POKEMON
 from utils.database import close_database, get_database
 
 # Helper for embeds
@@ -569,7 +569,7 @@ class SmogonBot(commands.Bot):
         2. Database connection initialization.
         3. Loading of guild configurations.
         4. Extension (Cog) loading.
-        5. API connectivity validation.
+        5. API connectivity validation (and sprite cache prewarming).
         6. Slash command synchronization.
         """
         logger.info("Bot setup hook called - performing async initialization")
@@ -589,7 +589,11 @@ class SmogonBot(commands.Bot):
         logger.info("Validating API connectivity...")
         smogon_cog = self.get_cog("Smogon")
         if smogon_cog and hasattr(smogon_cog, "api_client"):
-            await smogon_cog.api_client.validate_api_connectivity()  # type: ignore
+            api_status = await smogon_cog.api_client.validate_api_connectivity()  # type: ignore
+
+            # Warm popular sprites in the background once PokeAPI is reachable
+            if api_status.get("pokeapi"):
+                smogon_cog.api_client.start_sprite_prewarm(SPRITE_PREWARM_POKEMON)  # type: ignore
 
         # Sync slash commands
         try:
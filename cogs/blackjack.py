@@ -9,7 +9,6 @@ It handles:
 - integration with the game engine and UI views.
 """
 
-import asyncio
 import logging
 from typing import Dict, Optional
 
@@ -340,7 +339,7 @@ class Blackjack(commands.Cog):
             return
 
         # Start turn timer
-        asyncio.create_task(game_view.start_turn_timer())
+        await game_view.start_turn_timer()
 
     async def _leave_game(self, interaction: discord.Interaction):
         """Allow a player to leave the game lobby before it starts."""
@@ -707,7 +706,7 @@ class Blackjack(commands.Cog):
             return
 
         # Start turn timer
-        asyncio.create_task(game_view.start_turn_timer())
+        await game_view.start_turn_timer()
 
     @bj_prefix.error
     async def bj_prefix_error(
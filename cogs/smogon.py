@@ -10,7 +10,7 @@ Pokemon sets, EV yields, and sprites. It handles:
 """
 
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import discord
 from discord.ext import commands
@@ -22,7 +22,7 @@ from config.settings import (
     SMOGON_COMMAND_COOLDOWN,
     SPRITE_COMMAND_COOLDOWN,
 )
-from utils.api_clients import SmogonAPIClient
+from utils.api_clients import SmogonAPIClient, _normalize_pokemon
 from utils.constants import VIEW_TIMEOUT_SECONDS
 from utils.decorators import hybrid_defer
 from utils.helpers import (
@@ -72,6 +72,26 @@ class Smogon(commands.Cog):
         self.bot.loop.create_task(self.api_client.close())
         logger.info("Smogon cog unloaded")
 
+    async def _get_name_suggestions(self, pokemon: str) -> List[str]:
+        """
+        Fuzzy-match a failed lookup against known Pokemon names.
+
+        An exact match means the name was spelled correctly (it just has no
+        data), so the fuzzy scan is skipped.
+
+        Args:
+            pokemon: Pokemon name the user searched for.
+
+        Returns:
+            List of suggested names (possibly empty).
+        """
+        name_set = await self.api_client.get_pokemon_name_set()
+        if _normalize_pokemon(pokemon) in name_set:
+            return []
+
+        all_names = await self.api_client.get_all_pokemon_names()
+        return await get_close_matches_async(pokemon, all_names)
+
     @commands.hybrid_command(
         name="smogon",
         description="Get competitive movesets from Smogon University",
@@ -174,8 +194,7 @@ class Smogon(commands.Cog):
                     )
 
                     # Fetch suggestions
-                    all_names = await self.api_client.get_all_pokemon_names()
-                    matches = await get_close_matches_async(pokemon, all_names)
+                    matches = await self._get_name_suggestions(pokemon)
 
                     if matches:
                         suggestions_text = "\n".join(
@@ -224,8 +243,7 @@ class Smogon(commands.Cog):
                     )
 
                     # Fetch suggestions
-                    all_names = await self.api_client.get_all_pokemon_names()
-                    matches = await get_close_matches_async(pokemon, all_names)
+                    matches = await self._get_name_suggestions(pokemon)
 
                     if matches:
                         suggestions_text = "\n".join(
@@ -313,8 +331,7 @@ class Smogon(commands.Cog):
             if not ev_data:
                 error_desc = f"Could not find EV yield data for **{capitalize_pokemon_name(pokemon)}**."
 
-                all_names = await self.api_client.get_all_pokemon_names()
-                matches = await get_close_matches_async(pokemon, all_names)
+                matches = await self._get_name_suggestions(pokemon)
 
                 if matches:
                     suggestions_text = "\n".join(
@@ -439,8 +456,7 @@ class Smogon(commands.Cog):
                     f"Could not find sprite for **{capitalize_pokemon_name(pokemon)}**."
                 )
 
-                all_names = await self.api_client.get_all_pokemon_names()
-                matches = await get_close_matches_async(pokemon, all_names)
+                matches = await self._get_name_suggestions(pokemon)
 
                 if matches:
                     suggestions_text = "\n".join(
@@ -110,6 +110,10 @@ COLOR_INFO = 0x2196F3  # Blue
 
 # Cache Configuration
 CACHE_TIMEOUT = 60  # Cache duration in seconds
+CACHE_STALE_TIMEOUT = CACHE_TIMEOUT * 5  # Serve stale sets (while refreshing) up to this age
+POKEMON_NAMES_CACHE_TIMEOUT = 86400  # Name list for fuzzy matching (24 hours)
+NEGATIVE_CACHE_TIMEOUT = 900  # Remember PokeAPI 404s (e.g., typos) for 15 minutes
+SPRITE_CACHE_TIMEOUT = 3600  # Sprite URLs rarely change (1 hour)
 MAX_CACHE_SIZE = 200
 CACHE_CLEANUP_INTERVAL = 300  # Cleanup interval in seconds
 CACHE_PERSIST_TO_DISK = True
@@ -316,9 +320,6 @@ BLACKJACK_TURN_TIMEOUT_DEFAULT = 60  # Default turn timeout in seconds
 BLACKJACK_TURN_TIMEOUT_MIN = 30  # Minimum turn timeout
 BLACKJACK_TURN_TIMEOUT_MAX = 120  # Maximum turn timeout
 
-BLACKJACK_TURN_TIMER_WARNING_THRESHOLD = 15  # Show countdown when ≤ this many seconds
-BLACKJACK_TURN_TIMER_UPDATE_INTERVAL = 5  # Update countdown every N seconds
-
 
 def validate_settings():
     """
@@ -332,6 +333,9 @@ def validate_settings():
     if CACHE_TIMEOUT <= 0:
         raise ValueError("CACHE_TIMEOUT must be positive")
 
+    if CACHE_STALE_TIMEOUT < CACHE_TIMEOUT:
+        raise ValueError("CACHE_STALE_TIMEOUT must be >= CACHE_TIMEOUT")
+
     if MAX_CACHE_SIZE < 1:
         raise ValueError("MAX_CACHE_SIZE must be at least 1")
 
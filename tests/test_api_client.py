@@ -1,11 +1,20 @@
 import asyncio
+import time
 from unittest.mock import AsyncMock
 
 import pytest
 import pytest_asyncio  # NEW IMPORT
 
-from utils.api_clients import SmogonAPIClient
+from config.settings import (
+    CACHE_STALE_TIMEOUT,
+    CACHE_TIMEOUT,
+    NEGATIVE_CACHE_TIMEOUT,
+    POKEMON_NAMES_CACHE_TIMEOUT,
+    SPRITE_CACHE_TIMEOUT,
+)
+from utils.api_clients import SmogonAPIClient, _hash_cache_key, _normalize_pokemon
 from utils.circuit_breaker import CircuitBreakerError
+from utils.database import Database
 
 
 @pytest.mark.asyncio
@@ -17,6 +26,14 @@ class TestSmogonAPIClient:
         yield client
         await client.close()
 
+    @pytest_asyncio.fixture
+    async def sqlite_db(self, tmp_path, mocker):
+        db = Database(f"sqlite:///{tmp_path / 'cache.db'}")
+        await db.connect()
+        mocker.patch("utils.api_clients.get_database", AsyncMock(return_value=db))
+        yield db
+        await db.close()
+
     async def test_deduplication(self, client):
         """Test that concurrent requests for same resource only trigger one fetch"""
 
@@ -39,6 +56,32 @@ class TestSmogonAPIClient:
         # The actual fetch should have only been called ONCE
         assert mock_fetch.call_count == 1
 
+    async def test_deduplication_releases_state(self, client):
+        """Test that no per-key state is retained once a request completes"""
+
+        async def fetch():
+            return "data"
+
+        await client._deduplicate_request("key_a", fetch)
+        await client._deduplicate_request("key_b", fetch)
+
+        assert client._pending_requests == {}
+
+    async def test_deduplication_propagates_errors(self, client):
+        """Test that a failed fetch is raised to the creator and all joiners"""
+
+        async def failing_fetch():
+            await asyncio.sleep(0.05)
+            raise ValueError("boom")
+
+        tasks = [
+            client._deduplicate_request("fail_key", failing_fetch) for _ in range(3)
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert client._pending_requests == {}
+
     async def test_circuit_breaker_activates(self, client):
         """Test that circuit breaker opens after failures"""
 
@@ -59,3 +102,311 @@ class TestSmogonAPIClient:
         # Third call should raise CircuitBreakerError instantly
         with pytest.raises(CircuitBreakerError):
             await client._smogon_breaker.call(failing_func)
+
+    async def test_cache_stats_counters(self, client):
+        """Test that reading the counters does not change their values"""
+        client.cache_hits += 2
+        client.cache_misses += 3
+
+        assert client.cache_hits == 2
+        assert client.cache_hits == 2
+        assert client.cache_misses == 3
+
+        stats = client.get_cache_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 3
+        assert stats["hit_rate"] == "40.0%"
+
+    async def test_l1_cache_lru_eviction(self, client, mocker):
+        """Test that the L1 cache evicts least recently used entries and expires"""
+        mocker.patch("utils.api_clients.L1_CACHE_MAX_SIZE", 2)
+
+        client._l1_set("a", 1)
+        client._l1_set("b", 2)
+        assert client._l1_get("a") == 1  # "a" is now most recently used
+
+        client._l1_set("c", 3)
+        assert client._l1_get("b") is None
+        assert client._l1_get("a") == 1
+        assert client._l1_get("c") == 3
+
+        # Expired entries are dropped on read
+        client._l1_cache["a"] = (0.0, 1)
+        assert client._l1_get("a") is None
+        assert "a" not in client._l1_cache
+
+    async def test_access_tracking_is_batched(self, client, mocker):
+        """Test that cache hits are buffered and flushed in one database call"""
+        db = AsyncMock()
+        mocker.patch("utils.api_clients.get_database", AsyncMock(return_value=db))
+
+        client._record_access("a")
+        client._record_access("a")
+        client._record_access("b")
+        db.bulk_touch_cache.assert_not_called()
+
+        await client._flush_access_buffer()
+
+        db.bulk_touch_cache.assert_awaited_once_with({"a": 2, "b": 1})
+        assert client._access_buffer == {}
+
+    async def test_l1_promotion_keeps_row_age(self, client, mocker):
+        """Test that rows loaded into L1 only live out the rest of their TTL"""
+        db = AsyncMock()
+        db.get_cache_entry.return_value = (["ou"], CACHE_TIMEOUT - 5)
+        db.get_cache_entries_many.return_value = {
+            _hash_cache_key("many"): (["uu"], CACHE_TIMEOUT - 5)
+        }
+        mocker.patch("utils.api_clients.get_database", AsyncMock(return_value=db))
+
+        assert await client._get_cached("one") == ["ou"]
+        assert await client._get_cached_many(["many"]) == {"many": ["uu"]}
+
+        for key in ("one", "many"):
+            expires_at, _data = client._l1_cache[_hash_cache_key(key)]
+            assert expires_at - time.monotonic() <= 5
+
+    async def test_cleanup_respects_entry_ttl(self, client, sqlite_db, mocker):
+        """Test that database rows are purged by their own TTL, not a global age"""
+        await client._set_cache("names", ["bulbasaur"], POKEMON_NAMES_CACHE_TIMEOUT)
+        await client._set_cache("tiers", ["ou"])
+
+        now = time.time()
+        mocker.patch(
+            "utils.database.time.time", return_value=now + CACHE_STALE_TIMEOUT + 1
+        )
+        await client._cleanup_expired_cache()
+
+        names = await sqlite_db.get_cache(
+            _hash_cache_key("names"), POKEMON_NAMES_CACHE_TIMEOUT
+        )
+        assert names == ["bulbasaur"]
+        assert (await sqlite_db.get_cache_stats())["size"] == 1
+
+    async def test_sprite_fetch_checks_generation(self, client, mocker):
+        """Test that sprite lookups respect the species' introduction generation"""
+        responses = {
+            "pokemon-species/sprigatito": {
+                "generation": {"url": "https://pokeapi.co/api/v2/generation/9/"}
+            },
+            "pokemon/sprigatito": {
+                "name": "sprigatito",
+                "id": 906,
+                "sprites": {"front_default": "https://img/906.png"},
+            },
+        }
+
+        async def fake_fetch(session, url):
+            return responses[url.split("/api/v2/")[1]]
+
+        mocker.patch.object(client, "get_session", AsyncMock())
+        mocker.patch.object(client, "_fetch_pokeapi_json", side_effect=fake_fetch)
+        mocker.patch.object(client, "_set_cache", AsyncMock())
+
+        result = await client._fetch_pokemon_sprite("sprigatito", False, 1, "k")
+        assert result["error"] == "pokemon_not_in_generation"
+        assert result["introduced_gen"] == 9
+
+        result = await client._fetch_pokemon_sprite("sprigatito", False, 9, "k")
+        assert result["sprite_url"] == "https://img/906.png"
+        assert result["id"] == 906
+
+    async def test_stale_sets_served_while_refreshing(self, client, mocker):
+        """Test that stale sets are returned immediately and refreshed in background"""
+        stale_sets = {"Old Set": {"moves": ["Tackle"]}}
+        fresh_sets = {"New Set": {"moves": ["Protect"]}}
+        db = AsyncMock()
+        db.get_cache_entry.return_value = (stale_sets, CACHE_TIMEOUT + 1)
+        mocker.patch("utils.api_clients.get_database", AsyncMock(return_value=db))
+        fetch = mocker.patch.object(
+            client, "_fetch_smogon_sets", AsyncMock(return_value=fresh_sets)
+        )
+
+        result = await client.get_sets("Garchomp", "gen9", "ou")
+        assert result == stale_sets
+        assert len(client._refresh_tasks) == 1
+
+        await asyncio.gather(*client._refresh_tasks)
+        fetch.assert_awaited_once_with("garchomp", "gen9ou", "gen9ou:garchomp")
+
+    async def test_get_sets_many_fetches_only_misses(self, client, mocker):
+        """Test that bulk lookups batch the cache and fetch only missing tiers"""
+        ou_sets = {"Swords Dance": {"moves": ["Earthquake"]}}
+        uu_sets = {"Stealth Rock": {"moves": ["Stealth Rock"]}}
+        mocker.patch.object(
+            client,
+            "_get_cached_many",
+            AsyncMock(return_value={"gen9ou:garchomp": ou_sets}),
+        )
+        fetch = mocker.patch.object(
+            client, "_fetch_smogon_sets", AsyncMock(side_effect=[uu_sets, None])
+        )
+
+        result = await client.get_sets_many("Garchomp", "gen9", ["ou", "uu", "ru"])
+
+        assert result == {"ou": ou_sets, "uu": uu_sets}
+        client._get_cached_many.assert_awaited_once_with(
+            ["gen9ou:garchomp", "gen9uu:garchomp", "gen9ru:garchomp"]
+        )
+        assert fetch.await_count == 2
+
+    async def test_pokemon_names_fetched_once_concurrently(self, client, mocker):
+        """Test that concurrent cold-cache name lookups share one download"""
+        mocker.patch.object(client, "_get_cached", AsyncMock(return_value=None))
+
+        async def slow_fetch(cache_key):
+            await asyncio.sleep(0.05)
+            return ["bulbasaur", "ivysaur"]
+
+        fetch = mocker.patch.object(
+            client, "_fetch_all_pokemon_names", side_effect=slow_fetch
+        )
+
+        results = await asyncio.gather(
+            *(client.get_all_pokemon_names() for _ in range(5))
+        )
+
+        assert fetch.call_count == 1
+        assert all(names == ["bulbasaur", "ivysaur"] for names in results)
+
+    async def test_name_set_rebuilt_after_timeout(self, client, mocker):
+        """Test that the name set is reused until the names cache timeout"""
+        names = mocker.patch.object(
+            client, "get_all_pokemon_names", AsyncMock(return_value=["mew"])
+        )
+        clock = mocker.patch("utils.api_clients.time.monotonic", return_value=0.0)
+
+        assert await client.get_pokemon_name_set() == {"mew"}
+        assert await client.get_pokemon_name_set() == {"mew"}
+        assert names.await_count == 1
+
+        clock.return_value = POKEMON_NAMES_CACHE_TIMEOUT
+        names.return_value = ["mew", "mewtwo"]
+        assert await client.get_pokemon_name_set() == {"mew", "mewtwo"}
+        assert names.await_count == 2
+
+    async def test_sprite_404_is_negatively_cached(self, client, mocker):
+        """Test that a missing Pokemon is remembered instead of re-fetched"""
+        db = AsyncMock()
+        db.get_cache_entry.return_value = None
+        mocker.patch("utils.api_clients.get_database", AsyncMock(return_value=db))
+        mocker.patch.object(client, "get_session", AsyncMock())
+        fetch = mocker.patch.object(
+            client, "_fetch_pokeapi_json", AsyncMock(return_value=None)
+        )
+
+        assert await client.get_pokemon_sprite("Garchmop") is None
+        calls = fetch.await_count
+
+        assert await client.get_pokemon_sprite("Garchmop") is None
+        assert fetch.await_count == calls
+
+    async def test_negative_entries_expire_after_l1_eviction(
+        self, client, sqlite_db, mocker
+    ):
+        """Test that 404 sentinels reloaded from the database keep their short TTL"""
+        await client._set_negative_cache("sprite", SPRITE_CACHE_TIMEOUT)
+        await client._set_negative_cache("ev")
+        now = time.time()
+        clock = mocker.patch("utils.database.time.time")
+
+        # Shortly before expiry the sentinel is promoted for only the time left
+        client._l1_cache.clear()
+        clock.return_value = now + NEGATIVE_CACHE_TIMEOUT - 10
+        assert await client._get_cached("sprite", SPRITE_CACHE_TIMEOUT) is not None
+        expires_at, _data = client._l1_cache[_hash_cache_key("sprite")]
+        assert expires_at - time.monotonic() <= 10
+
+        client._l1_cache.clear()
+        clock.return_value = now + NEGATIVE_CACHE_TIMEOUT + 1
+        assert await client._get_cached("sprite", SPRITE_CACHE_TIMEOUT) is None
+
+        # EV yields are only cached for CACHE_TIMEOUT, so their misses are too
+        clock.return_value = now + CACHE_TIMEOUT + 1
+        assert await client._get_cached("ev") is None
+
+    async def test_prewarm_sprites_counts_successes(self, client, mocker):
+        """Test that sprite prewarming fetches every name and tolerates failures"""
+
+        async def fake_sprite(name, shiny, generation):
+            if name == "missingno":
+                raise ValueError("boom")
+            return {"sprite_url": f"https://img/{name}.png"}
+
+        mocker.patch.object(client, "get_pokemon_sprite", side_effect=fake_sprite)
+
+        warmed = await client.prewarm_sprites(["pikachu", "missingno", "eevee"])
+
+        assert warmed == 2
+        assert client.get_pokemon_sprite.call_count == 3
+
+    async def test_worker_pool_surfaces_worker_death(self, client):
+        """Test that a worker killed mid-batch fails the pool instead of hanging"""
+
+        async def fake_func(item):
+            if item == 2:
+                raise asyncio.CancelledError
+            return item
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(client._worker_pool(range(5), fake_func, 1), 1)
+
+    async def test_prewarmed_sprites_survive_cleanup(self, client, sqlite_db, mocker):
+        """Test that prewarmed sprites stay in the database past the stale window"""
+        responses = {
+            "pokemon-species/pikachu": {
+                "generation": {"url": "https://pokeapi.co/api/v2/generation/1/"}
+            },
+            "pokemon/pikachu": {
+                "name": "pikachu",
+                "id": 25,
+                "sprites": {"front_default": "https://img/25.png"},
+            },
+        }
+
+        async def fake_fetch(session, url):
+            return responses[url.split("/api/v2/")[1]]
+
+        mocker.patch.object(client, "get_session", AsyncMock())
+        fetch = mocker.patch.object(
+            client, "_fetch_pokeapi_json", side_effect=fake_fetch
+        )
+
+        assert await client.prewarm_sprites(["pikachu"]) == 1
+        calls = fetch.call_count
+
+        later = time.time() + CACHE_STALE_TIMEOUT + 1
+        mocker.patch("utils.database.time.time", return_value=later)
+        await client._cleanup_expired_cache()
+        client._l1_cache.clear()
+
+        sprite = await client.get_pokemon_sprite("pikachu")
+        assert sprite["sprite_url"] == "https://img/25.png"
+        assert fetch.call_count == calls
+
+    async def test_worker_pool_bounds_concurrency(self, client):
+        """Test that the worker pool keeps input order and caps concurrency"""
+        active = 0
+        peak = 0
+
+        async def work(item):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if item == 3:
+                raise ValueError("bad item")
+            return item * 2
+
+        results = await client._worker_pool(range(10), work, 3)
+
+        assert peak == 3
+        assert results[:3] == [0, 2, 4]
+        assert isinstance(results[3], ValueError)
+        assert results[9] == 18
+
+
+def test_normalize_pokemon():
+    assert _normalize_pokemon("  Iron Valiant ") == "iron-valiant"
+    assert _normalize_pokemon("landorus-therian") == "landorus-therian"
@@ -1,6 +1,10 @@
+import pytest
+
 from utils.blackjack_deck import Card, Deck
+from utils.blackjack_game import BlackjackGame, HandStatus, Player, PlayerHand
 from utils.blackjack_helpers import (
     calculate_hand_value,
+    can_split,
     determine_winner,
     is_bust,
     is_soft_hand,
@@ -12,6 +16,11 @@ class TestBlackjackHelpers:
         assert Card("♠", "A").value == 11
         assert Card("♠", "K").value == 10
         assert Card("♠", "5").value == 5
+        assert Card("♠", "A").is_ace and not Card("♠", "10").is_ace
+
+    def test_card_emoji_fallback(self):
+        assert Card("♥", "K").get_emoji().startswith("<:king_of_hearts:")
+        assert Card("?", "K").get_emoji() == "K?"
 
     def test_hand_calculation_simple(self):
         hand = [Card("♠", "10"), Card("♥", "5")]
@@ -44,6 +53,73 @@ class TestBlackjackHelpers:
         assert is_bust([Card("♠", "10"), Card("♥", "10"), Card("♦", "5")]) is True  # 25
         assert is_bust([Card("♠", "10"), Card("♥", "A")]) is False  # 21
 
+    def test_player_hand_running_total(self):
+        hand = PlayerHand(cards=[Card("♠", "A")])
+        assert hand.value == 11 and hand.is_soft
+
+        for rank in ["A", "9", "5"]:
+            hand.add_card(Card("♥", rank))
+            assert hand.value == calculate_hand_value(hand.cards)
+            assert hand.is_soft == is_soft_hand(hand.cards)
+            assert hand.is_bust == is_bust(hand.cards)
+
+        hand.add_card(Card("♦", "K"))
+        assert hand.value == 26 and hand.is_bust and not hand.is_soft
+
+        assert PlayerHand(cards=[Card("♠", "A"), Card("♥", "K")]).is_blackjack
+        assert not PlayerHand(cards=[Card("♠", "7")] * 3).is_blackjack
+
+    def test_player_tracks_active_hands(self):
+        player = Player(user_id=1, username="p")
+        player.split_current_hand(PlayerHand(), PlayerHand())
+        assert not player.all_hands_finished()
+
+        player.set_hand_status(player.hands[0], HandStatus.STAND)
+        player.set_hand_status(player.hands[0], HandStatus.STAND)
+        assert not player.all_hands_finished()
+
+        player.set_hand_status(player.hands[1], HandStatus.BUST)
+        assert player.all_hands_finished()
+        assert player.has_competitive_hand()
+
+        player.set_hand_status(player.hands[0], HandStatus.SURRENDER)
+        assert not player.has_competitive_hand()
+
+    def test_draw_actions_return_results(self):
+        game = BlackjackGame(channel_id=1, dealer_id=2, dealer_name="dealer")
+        game.deck = Deck(seed=5)  # Player starts on a hard 9
+        game.add_player(3, "player")
+        game.start_game()
+
+        assert not game.hit(999)
+
+        result = game.hit(3)
+        assert result.success and result.card in game.players[0].hands[0].cards
+        assert not result.bust and not result.hand_finished
+
+        result = game.double_down(3)
+        assert not result  # Only allowed on the first two cards
+
+    def test_hand_line_rendered_once_per_state(self):
+        game = BlackjackGame(channel_id=1, dealer_id=2, dealer_name="dealer")
+        hand = PlayerHand(cards=[Card("♠", "9"), Card("♥", "7")])
+        calls = []
+
+        def render(hand, use_emojis):
+            calls.append(use_emojis)
+            return f"{hand.total} {use_emojis}"
+
+        first = game.get_hand_line(hand, render)
+        assert game.get_hand_line(hand, render) == first
+        game.toggle_style()
+        assert game.get_hand_line(hand, render) != first
+        assert len(calls) == 2
+
+    def test_can_split(self):
+        assert can_split([Card("♠", "8"), Card("♥", "8")])
+        assert not can_split([Card("♠", "10"), Card("♥", "K")])  # Same value only
+        assert not can_split([Card("♠", "8"), Card("♥", "8"), Card("♦", "8")])
+
     def test_determine_winner(self):
         # Standard wins
         assert determine_winner(20, 19) == "win"
@@ -81,3 +157,24 @@ class TestDeck:
         card = deck.draw()
         assert isinstance(card, Card)
         assert len(deck) == initial_len - 1
+
+    def test_reset_reshuffles_full_shoe(self):
+        deck = Deck(seed=42)
+        first_order = list(deck.cards)
+        deck.draw_many(5)
+        deck.reset()
+        assert len(deck) == 104
+        assert deck.cards != first_order
+        assert sorted(deck.cards, key=str) == sorted(first_order, key=str)
+
+    def test_seeded_decks_match(self):
+        first, second = Deck(seed=7), Deck(seed=7)
+        assert [first.draw() for _ in range(10)] == [second.draw() for _ in range(10)]
+
+    def test_draw_many_matches_sequential_draws(self):
+        deck_a, deck_b = Deck(seed=7), Deck(seed=7)
+        assert deck_a.draw_many(3) == [deck_b.draw() for _ in range(3)]
+        assert len(deck_a) == len(deck_b)
+
+        with pytest.raises(IndexError):
+            deck_a.draw_many(len(deck_a) + 1)
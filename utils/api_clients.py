@@ -7,23 +7,31 @@ pooling, circuit breakers, request deduplication, and database-backed caching.
 """
 
 import asyncio
+import functools
 import hashlib
 import logging
-from collections import defaultdict
-from typing import Any, Dict, Optional
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 import aiohttp
+import orjson
 
 from config.settings import (
     API_REQUEST_TIMEOUT,
     CACHE_CLEANUP_INTERVAL,
+    CACHE_STALE_TIMEOUT,
     CACHE_TIMEOUT,
     FORMATS_BY_GEN,
     MAX_CACHE_SIZE,
     MAX_CONCURRENT_API_REQUESTS,
+    NEGATIVE_CACHE_TIMEOUT,
     POKEAPI_URL,
+    POKEMON_NAMES_CACHE_TIMEOUT,
     PRIORITY_FORMATS,
     SMOGON_SETS_URL,
+    SPRITE_CACHE_TIMEOUT,
 )
 from utils.api_models import (
     CacheStats,
@@ -36,7 +44,9 @@ from utils.circuit_breaker import CircuitBreaker, CircuitBreakerError
 from utils.constants import (
     API_STARTUP_VALIDATION_TIMEOUT,
     CACHE_KEY_HASH_ALGORITHM,
+    CACHE_SAVE_DEBOUNCE_SECONDS,
     GLOBAL_API_MAX_CONCURRENT,
+    SPRITE_PREWARM_CONCURRENCY,
 )
 from utils.database import get_database
 from utils.decorators import retry_on_error
@@ -45,8 +55,110 @@ logger = logging.getLogger("smogon_bot.api")
 
 # Connection pool settings
 CONNECTION_POOL_LIMIT = 100  # Total connections across all hosts
-CONNECTION_POOL_LIMIT_PER_HOST = 30  # Max connections per host
-CONNECTION_KEEPALIVE_TIMEOUT = 30  # Seconds to keep idle connections
+CONNECTION_POOL_LIMIT_PER_HOST = 8  # Max connections per host (polite to PokeAPI)
+CONNECTION_KEEPALIVE_TIMEOUT = 60  # Seconds to keep idle connections
+SESSION_RECYCLE_INTERVAL = 600  # Seconds before the session is replaced
+
+# In-process L1 cache settings (sits in front of the SQLite cache)
+L1_CACHE_MAX_SIZE = 512  # Entries kept in memory
+
+# Number of hashed cache keys memoized in-process
+CACHE_KEY_HASH_MEMO_SIZE = 4096
+# Number of normalized Pokemon names memoized in-process
+POKEMON_NAME_MEMO_SIZE = 2048
+
+# Translation table for name normalization (single C-level pass)
+_SPACE_TO_DASH = str.maketrans(" ", "-")
+
+# Cached in place of PokeAPI resources that returned 404
+_NEGATIVE_CACHE_ENTRY = {"_negative": True}
+
+# Hash constructor resolved once; hashlib.new() dispatches by name per call
+_HASH_CTOR = getattr(hashlib, CACHE_KEY_HASH_ALGORITHM, hashlib.sha256)
+
+# PokeAPI endpoint prefixes, joined with a normalized name per request
+_POKEAPI_POKEMON_URL = f"{POKEAPI_URL}/pokemon/"
+_POKEAPI_SPECIES_URL = f"{POKEAPI_URL}/pokemon-species/"
+
+
+@functools.lru_cache(maxsize=POKEMON_NAME_MEMO_SIZE)
+def _normalize_pokemon(name: str) -> str:
+    """
+    Normalize a Pokemon name into the form used for API paths and cache keys.
+
+    Args:
+        name: Raw Pokemon name (e.g., 'Iron Valiant ').
+
+    Returns:
+        Lowercase, hyphenated name (e.g., 'iron-valiant').
+    """
+    return name.lower().strip().translate(_SPACE_TO_DASH)
+
+
+@functools.lru_cache(maxsize=CACHE_KEY_HASH_MEMO_SIZE)
+def _hash_cache_key(key: str) -> str:
+    """
+    Generate hashed cache key for improved performance and security.
+
+    Memoized because the same key is hashed on lookup and again on store
+    after a miss; repeat calls become a dictionary hit.
+
+    Args:
+        key: Original cache key string.
+
+    Returns:
+        Hashed key string.
+    """
+    return _HASH_CTOR(key.encode("utf-8")).hexdigest()
+
+
+# PokeAPI `sprites.versions` key per generation (Gen 9 uses the top-level sprites)
+GEN_VERSION_KEYS = MappingProxyType(
+    {
+        1: "generation-i",
+        2: "generation-ii",
+        3: "generation-iii",
+        4: "generation-iv",
+        5: "generation-v",
+        6: "generation-vi",
+        7: "generation-vii",
+        8: "generation-viii",
+        9: None,
+    }
+)
+
+# Preferred PokeAPI sprite games per generation, tried in order (main-series
+# sprites ahead of the small menu icons)
+GEN_GAME_PREFERENCE: Dict[int, Tuple[str, ...]] = {
+    1: ("red-blue", "yellow"),
+    2: ("crystal", "gold", "silver"),
+    3: ("emerald", "firered-leafgreen", "ruby-sapphire"),
+    4: ("diamond-pearl", "heartgold-soulsilver", "platinum"),
+    5: ("black-white",),
+    6: ("omegaruby-alphasapphire", "x-y"),
+    7: ("ultra-sun-ultra-moon", "icons"),
+    8: ("brilliant-diamond-shining-pearl", "icons"),
+}
+
+
+def _make_connector() -> aiohttp.TCPConnector:
+    """
+    Create the pooled connector shared by Smogon and PokeAPI requests.
+
+    Both APIs go through one session, so a single pool amortizes DNS and TLS
+    setup while `limit_per_host` caps fan-out to either host.
+
+    Returns:
+        Configured TCPConnector.
+    """
+    return aiohttp.TCPConnector(
+        limit=CONNECTION_POOL_LIMIT,  # Total connections
+        limit_per_host=CONNECTION_POOL_LIMIT_PER_HOST,  # Per host
+        ttl_dns_cache=300,  # DNS cache TTL (5 minutes)
+        keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT,  # Keep connections alive
+        force_close=False,  # Reuse connections
+        enable_cleanup_closed=True,  # Clean up closed connections
+    )
 
 
 class SmogonAPIClient:
@@ -64,7 +176,25 @@ class SmogonAPIClient:
 
     def __init__(self):
         self.base_url = SMOGON_SETS_URL
+
+        # Precomputed set URLs for every known format: format_id -> url
+        self._format_urls: Dict[str, str] = {
+            f"{gen}{tier}": f"{self.base_url}/{gen}{tier}.json"
+            for gen, tiers in FORMATS_BY_GEN.items()
+            for tier in tiers
+        }
         self.session: Optional[aiohttp.ClientSession] = None
+        self._session_created_at: float = 0.0
+
+        # Retired sessions are closed in the background once in-flight
+        # requests have had time to finish
+        self._session_close_tasks: Set[asyncio.Task] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+
+        # Shared timeout for startup connectivity probes
+        self._validation_timeout = aiohttp.ClientTimeout(
+            total=API_STARTUP_VALIDATION_TIMEOUT
+        )
 
         # Session creation lock to prevent race conditions during lazy loading
         self._session_lock = asyncio.Lock()
@@ -75,6 +205,14 @@ class SmogonAPIClient:
         # Per-session rate limiter (for individual requests)
         self._rate_limiter = asyncio.Semaphore(MAX_CONCURRENT_API_REQUESTS)
 
+        # In-memory L1 cache: hashed_key -> (expires_at monotonic, data)
+        self._l1_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+        # Cache hits waiting to be written to the database: hashed_key -> hits.
+        # Flushed in batches so cache reads don't each become a SQLite write.
+        self._access_buffer: Dict[str, int] = {}
+        self._access_flush_task: Optional[asyncio.Task] = None
+
         # Cache statistics (in-memory for performance)
         self.cache_hits = 0
         self.cache_misses = 0
@@ -102,37 +240,30 @@ class SmogonAPIClient:
             name="pokeapi",
         )
 
-        # Tracks in-flight requests to prevent duplicate API calls
-        self._pending_requests: Dict[str, asyncio.Task] = {}
-        self._request_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Tracks in-flight requests to prevent duplicate API calls.
+        # No lock needed: dict operations never yield to the event loop.
+        self._pending_requests: Dict[str, asyncio.Future] = {}
+
+        # Known Pokemon names for O(1) membership checks (filled lazily and
+        # rebuilt once it is older than POKEMON_NAMES_CACHE_TIMEOUT)
+        self._name_set: FrozenSet[str] = frozenset()
+        self._name_set_expires_at = 0.0
 
-        # Background cleanup task
+        # Background tasks
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
         self._is_closing = False
 
-    def _hash_cache_key(self, key: str) -> str:
-        """
-        Generate hashed cache key for improved performance and security.
-
-        Args:
-            key: Original cache key string.
-
-        Returns:
-            Hashed key string.
-        """
-        hash_obj = hashlib.new(CACHE_KEY_HASH_ALGORITHM)
-        hash_obj.update(key.encode("utf-8"))
-        return hash_obj.hexdigest()
-
     async def _deduplicate_request(
         self, key: str, fetch_func, *args, **kwargs
     ) -> Optional[Any]:
         """
         Deduplicate concurrent requests for the same data.
 
-        This employs a 'Release-then-Await' pattern: the lock is held only
-        while creating or retrieving the pending task, never while awaiting
-        the network result. This prevents serialization of concurrent requests.
+        The first caller registers a future via `dict.setdefault`, which is
+        atomic under asyncio's single-threaded loop, so no lock is needed. The
+        creator runs the fetch and resolves the future; every other caller
+        simply awaits it.
 
         Args:
             key: Unique key identifying this request resource.
@@ -143,46 +274,64 @@ class SmogonAPIClient:
         Returns:
             Result from fetch_func or shared result from a pending request.
         """
-        created = False
-        task = None
+        # 1. Register or join atomically (setdefault cannot be preempted)
+        new_future = asyncio.get_running_loop().create_future()
+        future = self._pending_requests.setdefault(key, new_future)
+
+        # 2. Joiners just await the creator's result
+        if future is not new_future:
+            logger.debug(
+                "Request deduplication: Joining existing request",
+                extra={"key": key[:50]},
+            )
+            return await future
 
-        # 1. Check or Create Task (Critical Section)
-        async with self._request_locks[key]:
-            if key in self._pending_requests:
-                # Join existing request
-                task = self._pending_requests[key]
-                logger.debug(
-                    "Request deduplication: Joining existing request",
-                    extra={"key": key[:50]},
-                )
-            else:
-                # Create new request
-                task = asyncio.create_task(fetch_func(*args, **kwargs))
-                self._pending_requests[key] = task
-                created = True
-                logger.debug(
-                    "Request deduplication: Starting new request",
-                    extra={"key": key[:50]},
-                )
+        logger.debug(
+            "Request deduplication: Starting new request",
+            extra={"key": key[:50]},
+        )
 
-        # 2. Await Result (Outside Lock)
+        # 3. Creator fetches, resolves waiters, then cleans up
         try:
-            return await task
+            result = await fetch_func(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark as retrieved so an unobserved failure isn't logged by asyncio
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
         finally:
-            # 3. Cleanup (Only creator should clean up to avoid race conditions)
-            if created:
-                async with self._request_locks[key]:
-                    # Verify we are cleaning up the correct task
-                    if (
-                        key in self._pending_requests
-                        and self._pending_requests[key] is task
-                    ):
-                        del self._pending_requests[key]
+            if self._pending_requests.get(key) is future:
+                del self._pending_requests[key]
 
-                logger.debug(
-                    "Request deduplication: Cleaned up request",
-                    extra={"key": key[:50]},
-                )
+            logger.debug(
+                "Request deduplication: Cleaned up request",
+                extra={"key": key[:50]},
+            )
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create a new aiohttp session with connection pooling configuration."""
+        timeout = aiohttp.ClientTimeout(total=API_REQUEST_TIMEOUT)
+
+        self._session_created_at = time.monotonic()
+
+        return aiohttp.ClientSession(
+            timeout=timeout,
+            connector=_make_connector(),
+            headers={"User-Agent": "Pokemon-Smogon-Discord-Bot/2.0"},
+        )
+
+    async def _close_session_later(self, session: aiohttp.ClientSession) -> None:
+        """Close a retired session after in-flight requests have timed out."""
+        try:
+            await asyncio.sleep(API_REQUEST_TIMEOUT)
+        finally:
+            await session.close()
 
     async def get_session(self) -> aiohttp.ClientSession:
         """
@@ -191,29 +340,35 @@ class SmogonAPIClient:
         Uses `TCPConnector` to limit total connections and reuse them via
         keep-alive, which is crucial for performance under high load.
 
+        The session is recycled every `SESSION_RECYCLE_INTERVAL` seconds so the
+        pool doesn't accumulate dead keep-alive sockets that force a fresh
+        TCP/TLS handshake. The old session is closed in the background.
+
         Returns:
             Active aiohttp ClientSession.
         """
         async with self._session_lock:
-            if self.session is None or self.session.closed:
-                timeout = aiohttp.ClientTimeout(total=API_REQUEST_TIMEOUT)
-
-                # Create TCPConnector with connection pooling
-                connector = aiohttp.TCPConnector(
-                    limit=CONNECTION_POOL_LIMIT,  # Total connections
-                    limit_per_host=CONNECTION_POOL_LIMIT_PER_HOST,  # Per host
-                    ttl_dns_cache=300,  # DNS cache TTL (5 minutes)
-                    keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT,  # Keep connections alive
-                    force_close=False,  # Reuse connections
-                    enable_cleanup_closed=True,  # Clean up closed connections
-                )
+            if (
+                self.session is not None
+                and not self.session.closed
+                and time.monotonic() - self._session_created_at
+                > SESSION_RECYCLE_INTERVAL
+            ):
+                old_session = self.session
+                self.session = self._create_session()
+
+                close_task = asyncio.create_task(self._close_session_later(old_session))
+                self._session_close_tasks.add(close_task)
+                close_task.add_done_callback(self._session_close_tasks.discard)
 
-                self.session = aiohttp.ClientSession(
-                    timeout=timeout,
-                    connector=connector,
-                    headers={"User-Agent": "Pokemon-Smogon-Discord-Bot/2.0"},
+                logger.info(
+                    "Recycled aiohttp session",
+                    extra={"recycle_interval": SESSION_RECYCLE_INTERVAL},
                 )
 
+            if self.session is None or self.session.closed:
+                self.session = self._create_session()
+
                 logger.info(
                     "Created aiohttp session with connection pooling",
                     extra={
@@ -237,68 +392,70 @@ class SmogonAPIClient:
 
         return self.session
 
-    async def validate_api_connectivity(self) -> Dict[str, bool]:
+    async def _probe_api(
+        self, session: aiohttp.ClientSession, api: str, url: str
+    ) -> Tuple[str, bool]:
         """
-        Validate connectivity to external APIs on startup.
+        Check that a single API endpoint responds with HTTP 200.
+
+        Args:
+            session: Active aiohttp session.
+            api: API name used in logs and results.
+            url: Endpoint to request.
 
         Returns:
-            Dictionary mapping API names ('smogon', 'pokeapi') to boolean status.
+            Tuple of (api name, reachable).
         """
-        results = {"smogon": False, "pokeapi": False}
-
-        logger.info(
-            "Validating API connectivity", extra={"apis": ["smogon", "pokeapi"]}
-        )
-
-        # Test Smogon API
         try:
-            session = await self.get_session()
-            test_url = f"{SMOGON_SETS_URL}/gen9ou.json"
-
-            async with asyncio.timeout(API_STARTUP_VALIDATION_TIMEOUT):
-                async with session.get(test_url) as resp:
-                    if resp.status == 200:
-                        results["smogon"] = True
-                        logger.info(
-                            "API reachable",
-                            extra={"api": "smogon", "status": "success"},
-                        )
-                    else:
-                        logger.warning(
-                            "API returned non-200 status",
-                            extra={"api": "smogon", "status_code": resp.status},
-                        )
+            async with session.get(url, timeout=self._validation_timeout) as resp:
+                if resp.status == 200:
+                    logger.info(
+                        "API reachable",
+                        extra={"api": api, "status": "success"},
+                    )
+                    return api, True
+
+                logger.warning(
+                    "API returned non-200 status",
+                    extra={"api": api, "status_code": resp.status},
+                )
         except asyncio.TimeoutError:
             logger.error(
                 "API connection timed out",
                 extra={
-                    "api": "smogon",
+                    "api": api,
                     "timeout_seconds": API_STARTUP_VALIDATION_TIMEOUT,
                 },
             )
         except Exception as e:
             logger.error(
                 "API validation failed",
-                extra={"api": "smogon", "error": str(e)},
+                extra={"api": api, "error": str(e)},
                 exc_info=True,
             )
 
-        # Test PokeAPI
-        try:
-            session = await self.get_session()
-            test_url = f"{POKEAPI_URL}/pokemon/1"
+        return api, False
 
-            async with asyncio.timeout(API_STARTUP_VALIDATION_TIMEOUT):
-                async with session.get(test_url) as resp:
-                    if resp.status == 200:
-                        results["pokeapi"] = True
-                        logger.info("✅ PokeAPI is reachable")
-                    else:
-                        logger.warning(f"⚠️ PokeAPI returned status {resp.status}")
-        except asyncio.TimeoutError:
-            logger.error("❌ PokeAPI connection timed out")
-        except Exception as e:
-            logger.error(f"❌ PokeAPI validation failed: {e}")
+    async def validate_api_connectivity(self) -> Dict[str, bool]:
+        """
+        Validate connectivity to external APIs on startup.
+
+        Both APIs are probed concurrently since they live on different hosts.
+
+        Returns:
+            Dictionary mapping API names ('smogon', 'pokeapi') to boolean status.
+        """
+        logger.info(
+            "Validating API connectivity", extra={"apis": ["smogon", "pokeapi"]}
+        )
+
+        session = await self.get_session()
+        results = dict(
+            await asyncio.gather(
+                self._probe_api(session, "smogon", f"{SMOGON_SETS_URL}/gen9ou.json"),
+                self._probe_api(session, "pokeapi", f"{POKEAPI_URL}/pokemon/1"),
+            )
+        )
 
         # Summary
         if all(results.values()):
@@ -312,10 +469,107 @@ class SmogonAPIClient:
 
         return results
 
+    async def _worker_pool(self, inputs: Iterable[Any], func, workers: int) -> List[Any]:
+        """
+        Run `func` over many inputs with a fixed number of worker coroutines.
+
+        Unlike gathering one task per input, only `workers` coroutines ever
+        exist, so large batches don't flood the event loop or the connector's
+        wait queue.
+
+        Args:
+            inputs: Items to process.
+            func: Async function called with each item.
+            workers: Number of concurrent workers.
+
+        Returns:
+            Results in input order; an exception raised for an item is
+            returned in its place.
+        """
+        items = list(inputs)
+        results: List[Any] = [None] * len(items)
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, item in enumerate(items):
+            queue.put_nowait((index, item))
+
+        async def _worker() -> None:
+            # Every item is queued up front, so an empty queue means we're done
+            while not queue.empty():
+                index, item = queue.get_nowait()
+                try:
+                    results[index] = await func(item)
+                except Exception as e:
+                    results[index] = e
+                finally:
+                    queue.task_done()
+
+        tasks = [asyncio.create_task(_worker()) for _ in range(max(1, workers))]
+        try:
+            # Awaiting the workers themselves (not queue.join) means a worker
+            # killed by a non-Exception error surfaces here instead of hanging
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return results
+
+    async def prewarm_sprites(self, names: Iterable[str], generation: int = 9) -> int:
+        """
+        Fetch sprites for commonly requested Pokemon ahead of time.
+
+        Requests run on a pool of `SPRITE_PREWARM_CONCURRENCY` workers;
+        duplicates collapse through request deduplication.
+
+        Args:
+            names: Pokemon names to warm.
+            generation: Sprite generation to warm.
+
+        Returns:
+            Number of sprites that were successfully cached.
+        """
+
+        async def _warm(name: str) -> Optional[PokeAPISprite]:
+            return await self.get_pokemon_sprite(name, False, generation)
+
+        results = await self._worker_pool(names, _warm, SPRITE_PREWARM_CONCURRENCY)
+        warmed = sum(
+            1
+            for result in results
+            if result and not isinstance(result, BaseException)
+        )
+        logger.info(
+            "Prewarmed sprite cache",
+            extra={"warmed": warmed, "requested": len(results)},
+        )
+        return warmed
+
+    def start_sprite_prewarm(self, names: Iterable[str], generation: int = 9) -> None:
+        """
+        Run `prewarm_sprites` in the background so startup isn't delayed.
+
+        Args:
+            names: Pokemon names to warm.
+            generation: Sprite generation to warm.
+        """
+        if self._prewarm_task and not self._prewarm_task.done():
+            return
+        self._prewarm_task = asyncio.create_task(
+            self.prewarm_sprites(names, generation)
+        )
+
     async def close(self) -> None:
         """Close the aiohttp session and cancel background tasks."""
         self._is_closing = True
 
+        if self._prewarm_task and not self._prewarm_task.done():
+            self._prewarm_task.cancel()
+            try:
+                await self._prewarm_task
+            except asyncio.CancelledError:
+                pass
+
         if self._cleanup_task and not self._cleanup_task.done():
             self._cleanup_task.cancel()
             try:
@@ -324,6 +578,28 @@ class SmogonAPIClient:
                 pass
             logger.info("Cancelled cache cleanup task")
 
+        if self._access_flush_task and not self._access_flush_task.done():
+            self._access_flush_task.cancel()
+            try:
+                await self._access_flush_task
+            except asyncio.CancelledError:
+                pass
+
+        # Drop in-flight background refreshes; the stale data is still cached
+        for refresh_task in list(self._refresh_tasks):
+            refresh_task.cancel()
+        if self._refresh_tasks:
+            await asyncio.gather(*self._refresh_tasks, return_exceptions=True)
+
+        # Persist any access tracking still buffered in memory
+        await self._flush_access_buffer()
+
+        # Close retired sessions immediately instead of waiting out the delay
+        for close_task in list(self._session_close_tasks):
+            close_task.cancel()
+        if self._session_close_tasks:
+            await asyncio.gather(*self._session_close_tasks, return_exceptions=True)
+
         if self.session and not self.session.closed:
             await self.session.close()
             logger.info(
@@ -351,35 +627,140 @@ class SmogonAPIClient:
             except Exception as e:
                 logger.error(f"Error in cache cleanup task: {e}")
 
+    def _record_access(self, hashed_key: str) -> None:
+        """
+        Buffer a cache hit for the next batched database update.
+
+        Starts the flush task on first use.
+
+        Args:
+            hashed_key: Hashed cache key that was read.
+        """
+        self._access_buffer[hashed_key] = self._access_buffer.get(hashed_key, 0) + 1
+
+        if not self._is_closing and (
+            self._access_flush_task is None or self._access_flush_task.done()
+        ):
+            self._access_flush_task = asyncio.create_task(self._access_flush_loop())
+
+    async def _access_flush_loop(self) -> None:
+        """Background task to periodically write buffered cache hits."""
+        while not self._is_closing:
+            try:
+                await asyncio.sleep(CACHE_SAVE_DEBOUNCE_SECONDS)
+                await self._flush_access_buffer()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in cache access flush task: {e}")
+
+    async def _flush_access_buffer(self) -> None:
+        """Write buffered cache hits to the database in one batch."""
+        if not self._access_buffer:
+            return
+
+        accesses = self._access_buffer
+        self._access_buffer = {}
+
+        try:
+            db = await get_database()
+            await db.bulk_touch_cache(accesses)
+        except Exception as e:
+            logger.error(f"Error flushing cache access: {e}", exc_info=True)
+
     async def _cleanup_expired_cache(self) -> None:
         """Remove expired entries from database cache."""
         try:
             db = await get_database()
-            deleted_count = await db.cleanup_expired_cache(CACHE_TIMEOUT)
+            deleted_count = await db.cleanup_expired_cache()
             if deleted_count > 0:
                 logger.debug(
-                    "Cleaned expired cache entries",
-                    extra={"count": deleted_count, "timeout_seconds": CACHE_TIMEOUT},
+                    "Cleaned expired cache entries", extra={"count": deleted_count}
                 )
         except Exception as e:
             logger.error(f"Error cleaning cache: {e}", exc_info=True)
 
-    async def _get_cached(self, key: str) -> Optional[Any]:
+    def _l1_get(self, hashed_key: str) -> Optional[Any]:
         """
-        Get data from database cache if not expired.
+        Look up an entry in the in-memory L1 cache.
+
+        Expired entries are dropped; live entries are marked most recently used.
+
+        Args:
+            hashed_key: Hashed cache key.
+
+        Returns:
+            Cached data or None if missing/expired.
+        """
+        entry = self._l1_cache.get(hashed_key)
+        if entry is None:
+            return None
+
+        expires_at, data = entry
+        if time.monotonic() >= expires_at:
+            del self._l1_cache[hashed_key]
+            return None
+
+        self._l1_cache.move_to_end(hashed_key)
+        return data
+
+    def _l1_set(self, hashed_key: str, data: Any, ttl: float = CACHE_TIMEOUT) -> None:
+        """
+        Store an entry in the in-memory L1 cache, evicting the least recently
+        used entry once `L1_CACHE_MAX_SIZE` is exceeded.
+
+        Args:
+            hashed_key: Hashed cache key.
+            data: Data to cache.
+            ttl: Seconds the entry stays valid.
+        """
+        self._l1_cache[hashed_key] = (time.monotonic() + ttl, data)
+        self._l1_cache.move_to_end(hashed_key)
+
+        if len(self._l1_cache) > L1_CACHE_MAX_SIZE:
+            self._l1_cache.popitem(last=False)
+
+    async def _get_cached(
+        self, key: str, max_age: float = CACHE_TIMEOUT
+    ) -> Optional[Any]:
+        """
+        Get data from cache if not expired.
+
+        Checks the in-memory L1 cache first and only falls through to the
+        database on a miss, populating L1 with whatever the database returns
+        for the rest of the row's lifetime (`max_age` minus its age).
+
+        Negative entries expire after NEGATIVE_CACHE_TIMEOUT (capped at
+        `max_age`), whichever layer they are read from.
 
         Args:
             key: Cache key.
+            max_age: Maximum age in seconds for a database entry to be used.
 
         Returns:
             Cached data object or None if missing/expired.
         """
         try:
-            hashed_key = self._hash_cache_key(key)
-            db = await get_database()
-            data = await db.get_cache(hashed_key, CACHE_TIMEOUT)
+            hashed_key = _hash_cache_key(key)
 
+            data = self._l1_get(hashed_key)
             if data is not None:
+                self._record_access(hashed_key)
+                self.cache_hits += 1
+                return data
+
+            db = await get_database()
+            entry = await db.get_cache_entry(hashed_key, max_age, update_access=False)
+
+            if entry is not None and entry[0] == _NEGATIVE_CACHE_ENTRY:
+                max_age = min(NEGATIVE_CACHE_TIMEOUT, max_age)
+                if entry[1] >= max_age:
+                    entry = None  # Negative entry outlived its shorter TTL
+
+            if entry is not None:
+                data, age = entry
+                self._l1_set(hashed_key, data, max_age - age)
+                self._record_access(hashed_key)
                 self.cache_hits += 1
                 logger.debug(
                     "Cache hit",
@@ -400,28 +781,178 @@ class SmogonAPIClient:
             self.cache_misses += 1
             return None
 
-    async def _set_cache(self, key: str, data: Any) -> None:
+    async def _get_cached_or_stale(self, key: str) -> Tuple[Optional[Any], bool]:
+        """
+        Get data from cache, accepting entries past CACHE_TIMEOUT.
+
+        Entries older than CACHE_TIMEOUT but younger than CACHE_STALE_TIMEOUT
+        are returned flagged as stale so the caller can serve them immediately
+        and refresh in the background. Stale data is never promoted to L1,
+        and fresh data is promoted only until it turns stale, so L1 hits are
+        always fresh.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Tuple of (cached data or None, whether the data is stale).
+        """
+        try:
+            hashed_key = _hash_cache_key(key)
+
+            data = self._l1_get(hashed_key)
+            if data is not None:
+                self._record_access(hashed_key)
+                self.cache_hits += 1
+                return data, False
+
+            db = await get_database()
+            entry = await db.get_cache_entry(
+                hashed_key, CACHE_STALE_TIMEOUT, update_access=False
+            )
+
+            if entry is None:
+                self.cache_misses += 1
+                return None, False
+
+            data, age = entry
+            stale = age >= CACHE_TIMEOUT
+            if not stale:
+                self._l1_set(hashed_key, data, CACHE_TIMEOUT - age)
+            self._record_access(hashed_key)
+            self.cache_hits += 1
+            logger.debug("Cache hit", extra={"cache_key": key[:50], "stale": stale})
+            return data, stale
+
+        except Exception as e:
+            logger.error(f"Error getting cache: {e}", exc_info=True)
+            self.cache_misses += 1
+            return None, False
+
+    def _schedule_refresh(self, key: str, fetch_func, *args, **kwargs) -> None:
+        """
+        Refresh a stale cache entry in the background.
+
+        Skips scheduling if a request for the same key is already in flight.
+
+        Args:
+            key: Deduplication key for the refresh.
+            fetch_func: Async function that fetches and caches fresh data.
+            *args: Positional arguments for fetch_func.
+            **kwargs: Keyword arguments for fetch_func.
+        """
+        if self._is_closing or key in self._pending_requests:
+            return
+
+        async def _refresh():
+            try:
+                await self._deduplicate_request(key, fetch_func, *args, **kwargs)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Background refresh failed for {key[:50]}: {e}")
+
+        task = asyncio.create_task(_refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _get_cached_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several entries from cache, querying the database in one round-trip.
+
+        Entries present in the L1 cache are served from memory; the rest are
+        fetched from the database together.
+
+        Args:
+            keys: Cache keys.
+
+        Returns:
+            Dictionary mapping each cached key to its data. Missing or expired
+            keys are omitted.
+        """
+        try:
+            results: Dict[str, Any] = {}
+            pending: Dict[str, str] = {}
+
+            for key in keys:
+                hashed_key = _hash_cache_key(key)
+                data = self._l1_get(hashed_key)
+                if data is not None:
+                    self._record_access(hashed_key)
+                    results[key] = data
+                else:
+                    pending[hashed_key] = key
+
+            if pending:
+                db = await get_database()
+                db_entries = await db.get_cache_entries_many(
+                    list(pending), CACHE_TIMEOUT, update_access=False
+                )
+
+                for hashed_key, (value, age) in db_entries.items():
+                    self._l1_set(hashed_key, value, CACHE_TIMEOUT - age)
+                    self._record_access(hashed_key)
+                    results[pending[hashed_key]] = value
+
+            self.cache_hits += len(results)
+            self.cache_misses += len(keys) - len(results)
+            return results
+
+        except Exception as e:
+            logger.error(f"Error getting cache batch: {e}", exc_info=True)
+            self.cache_misses += len(keys)
+            return {}
+
+    async def _set_cache(
+        self, key: str, data: Any, ttl: float = CACHE_TIMEOUT
+    ) -> None:
         """
-        Store data in database cache with automatic size management.
+        Store data in cache with automatic size management.
+
+        Writes through to both the L1 cache and the database. The database row
+        is kept for `ttl`, but never less than CACHE_STALE_TIMEOUT so stale
+        reads can still find short-lived entries.
 
         Args:
             key: Cache key.
             data: Serializable data object to store.
+            ttl: Seconds the entry stays fresh.
         """
         try:
-            hashed_key = self._hash_cache_key(key)
+            hashed_key = _hash_cache_key(key)
+            self._l1_set(hashed_key, data, ttl)
             db = await get_database()
-            await db.set_cache(hashed_key, data, MAX_CACHE_SIZE)
+            await db.set_cache(
+                hashed_key, data, MAX_CACHE_SIZE, max(ttl, CACHE_STALE_TIMEOUT)
+            )
             logger.debug("Data cached", extra={"cache_key": key[:50]})
         except Exception as e:
             logger.error(f"Error setting cache: {e}", exc_info=True)
 
+    async def _set_negative_cache(
+        self, key: str, max_age: float = CACHE_TIMEOUT
+    ) -> None:
+        """
+        Remember that a resource doesn't exist so repeated lookups (e.g., a
+        misspelled name) don't hit the API again for NEGATIVE_CACHE_TIMEOUT.
+
+        The negative TTL never exceeds the resource's positive TTL, so a miss
+        is not remembered longer than a hit would be.
+
+        Args:
+            key: Cache key of the missing resource.
+            max_age: Positive TTL of the resource (as passed to `_get_cached`).
+        """
+        await self._set_cache(
+            key, _NEGATIVE_CACHE_ENTRY, min(NEGATIVE_CACHE_TIMEOUT, max_age)
+        )
+
     @retry_on_error(max_retries=3)
     async def find_pokemon_in_generation(
         self, pokemon: str, generation: str
     ) -> Dict[str, Dict[str, SmogonSet]]:
         """
-        Find a Pokemon across all formats in a generation using batched parallel requests.
+        Find a Pokemon across all formats in a generation using parallel requests.
 
         This efficiently checks multiple tier definitions (OU, UU, etc.) concurrently
         to find where a Pokemon has valid movesets.
@@ -439,12 +970,7 @@ class SmogonAPIClient:
 
         if cached_tiers:
             logger.info(f"Using cached tier locations for {pokemon} in {generation}")
-            result = {}
-            for tier in cached_tiers:
-                sets = await self.get_sets(pokemon, generation, tier)
-                if sets:
-                    result[tier] = sets
-            return result
+            return await self.get_sets_many(pokemon, generation, cached_tiers)
 
         # Get available formats for this generation
         available_formats = FORMATS_BY_GEN.get(generation, PRIORITY_FORMATS)
@@ -453,29 +979,9 @@ class SmogonAPIClient:
             f"Searching for {pokemon} in {generation} across {len(available_formats)} formats"
         )
 
-        # Batch API requests to avoid overwhelming the API
-        BATCH_SIZE = 5
-        found_formats = {}
-
-        async with self._global_rate_limiter:
-            for i in range(0, len(available_formats), BATCH_SIZE):
-                batch = available_formats[i : i + BATCH_SIZE]
-                tasks = [
-                    self._fetch_format(pokemon, generation, tier) for tier in batch
-                ]
-
-                # Process batch with rate limiting
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Collect successful results from this batch
-                for tier, result in zip(batch, results):
-                    if result and not isinstance(result, Exception):
-                        found_formats[tier] = result
-                        logger.info(f"✓ Found {pokemon} in {generation}{tier}")
-
-                # Small delay between batches to be respectful
-                if i + BATCH_SIZE < len(available_formats):
-                    await asyncio.sleep(0.1)
+        found_formats = await self.get_sets_many(pokemon, generation, available_formats)
+        for tier in found_formats:
+            logger.info(f"✓ Found {pokemon} in {generation}{tier}")
 
         # Cache tier locations if found
         if found_formats:
@@ -483,18 +989,57 @@ class SmogonAPIClient:
 
         return found_formats
 
-    async def _fetch_format(
-        self, pokemon: str, generation: str, tier: str
-    ) -> Optional[Dict[str, SmogonSet]]:
-        """Internal method to fetch a specific format and find pokemon."""
-        try:
-            sets = await self.get_sets(pokemon, generation, tier)
-            return sets
-        except Exception as e:
-            logger.debug(f"Error fetching {generation}{tier}: {e}")
-            return None
+    async def get_sets_many(
+        self, pokemon: str, generation: str, tiers: List[str]
+    ) -> Dict[str, Dict[str, SmogonSet]]:
+        """
+        Fetch sets for several tiers of one generation in a single pass.
+
+        All tiers are looked up in the cache with one database query; only the
+        misses go to the network, concurrently. The rate limiters inside
+        `_fetch_smogon_sets` bound how many requests actually hit the API.
+
+        Args:
+            pokemon: Pokemon name.
+            generation: Generation string (e.g., 'gen9').
+            tiers: Competitive tiers to look up (e.g., ['ou', 'uu']).
+
+        Returns:
+            Dictionary mapping tier to sets data. Tiers without sets are omitted.
+        """
+        pokemon = _normalize_pokemon(pokemon)
+        generation = generation.lower().strip()
+
+        # Same keys as get_sets so both paths share cache entries
+        format_ids = {tier: f"{generation}{tier.lower().strip()}" for tier in tiers}
+        tier_keys = {tier: f"{fmt}:{pokemon}" for tier, fmt in format_ids.items()}
+        cached_sets = await self._get_cached_many(list(tier_keys.values()))
+
+        found: Dict[str, Dict[str, SmogonSet]] = {}
+        missing: List[str] = []
+        for tier, key in tier_keys.items():
+            sets = cached_sets.get(key)
+            if sets is None:
+                missing.append(tier)
+            elif sets:
+                found[tier] = sets
+
+        if missing:
+            results = await asyncio.gather(
+                *(
+                    self._fetch_sets(pokemon, format_ids[tier], tier_keys[tier])
+                    for tier in missing
+                ),
+                return_exceptions=True,
+            )
+            for tier, result in zip(missing, results):
+                if isinstance(result, Exception):
+                    logger.debug(f"Error fetching {generation}{tier}: {result}")
+                elif result:
+                    found[tier] = result
+
+        return found
 
-    @retry_on_error(max_retries=3)
     async def get_sets(
         self, pokemon: str, generation: str = "gen9", tier: str = "ou"
     ) -> Optional[Dict[str, SmogonSet]]:
@@ -502,7 +1047,7 @@ class SmogonAPIClient:
         Fetch competitive sets from Smogon for a specific format.
 
         Wrapper method that handles:
-        1. Cache lookup
+        1. Cache lookup (stale entries are served and refreshed in background)
         2. Request deduplication
         3. Circuit breaker protection
 
@@ -514,41 +1059,62 @@ class SmogonAPIClient:
         Returns:
             Dictionary of sets or None if not found.
         """
-        pokemon = pokemon.lower().strip().replace(" ", "-")
+        pokemon = _normalize_pokemon(pokemon)
         generation = generation.lower().strip()
         tier = tier.lower().strip()
 
         format_id = f"{generation}{tier}"
         cache_key = f"{format_id}:{pokemon}"
 
-        # Check cache first
-        cached = await self._get_cached(cache_key)
+        # Check cache first, serving stale sets while revalidating
+        cached, stale = await self._get_cached_or_stale(cache_key)
         if cached is not None:
+            if stale:
+                self._schedule_refresh(
+                    f"smogon:sets:{cache_key}",
+                    self._fetch_smogon_sets_guarded,
+                    pokemon,
+                    format_id,
+                    cache_key,
+                )
             return cached
 
-        # Deduplicate requests
-        dedup_key = f"smogon:sets:{cache_key}"
+        return await self._fetch_sets(pokemon, format_id, cache_key)
 
-        async def _fetch():
-            try:
-                return await self._smogon_breaker.call(
-                    self._fetch_smogon_sets, pokemon, format_id, cache_key
-                )
-            except CircuitBreakerError:
-                logger.error(
-                    f"Smogon API circuit breaker open for {format_id}",
-                    extra={"pokemon": pokemon, "format": format_id},
-                )
-                return None
+    @retry_on_error(max_retries=3)
+    async def _fetch_sets(
+        self, pokemon: str, format_id: str, cache_key: str
+    ) -> Optional[Dict[str, SmogonSet]]:
+        """Fetch sets from the network, deduplicating concurrent requests."""
+        return await self._deduplicate_request(
+            f"smogon:sets:{cache_key}",
+            self._fetch_smogon_sets_guarded,
+            pokemon,
+            format_id,
+            cache_key,
+        )
 
-        return await self._deduplicate_request(dedup_key, _fetch)
+    async def _fetch_smogon_sets_guarded(
+        self, pokemon: str, format_id: str, cache_key: str
+    ) -> Optional[Dict[str, SmogonSet]]:
+        """Fetch sets through the circuit breaker, returning None while it is open."""
+        try:
+            return await self._smogon_breaker.call(
+                self._fetch_smogon_sets, pokemon, format_id, cache_key
+            )
+        except CircuitBreakerError:
+            logger.error(
+                f"Smogon API circuit breaker open for {format_id}",
+                extra={"pokemon": pokemon, "format": format_id},
+            )
+            return None
 
     async def _fetch_smogon_sets(
         self, pokemon: str, format_id: str, cache_key: str
     ) -> Optional[Dict[str, SmogonSet]]:
         """Internal method to fetch from Smogon API (wrapped by circuit breaker)."""
         session = await self.get_session()
-        url = f"{self.base_url}/{format_id}.json"
+        url = self._format_urls.get(format_id) or f"{self.base_url}/{format_id}.json"
 
         logger.debug(f"Fetching {url}")
 
@@ -556,30 +1122,43 @@ class SmogonAPIClient:
             async with self._rate_limiter:
                 async with session.get(url) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = orjson.loads(await resp.read())
 
-                        # Search for Pokemon
+                        # Normalize names once so the exact match is a dict probe
+                        index: Dict[str, Tuple[str, Dict[str, SmogonSet]]] = {}
                         for poke_name, sets in data.items():
-                            if poke_name.lower().replace(" ", "-") == pokemon:
-                                await self._set_cache(cache_key, sets)
-                                logger.info(
-                                    "Found competitive sets",
-                                    extra={
-                                        "pokemon": pokemon,
-                                        "format": format_id,
-                                        "set_count": len(data),
-                                    },
-                                )
-                                return sets
+                            index.setdefault(
+                                poke_name.lower().translate(_SPACE_TO_DASH),
+                                (poke_name, sets),
+                            )
+
+                        # Search for Pokemon
+                        exact = index.get(pokemon)
+                        if exact is not None:
+                            sets = exact[1]
+                            await self._set_cache(cache_key, sets)
+                            logger.info(
+                                "Found competitive sets",
+                                extra={
+                                    "pokemon": pokemon,
+                                    "format": format_id,
+                                    "set_count": len(data),
+                                },
+                            )
+                            return sets
 
                         # Partial match
-                        for poke_name, sets in data.items():
-                            if pokemon in poke_name.lower().replace(" ", "-"):
-                                await self._set_cache(cache_key, sets)
-                                logger.info(
-                                    f"Found sets for {pokemon} (matched {poke_name}) in {format_id}"
-                                )
-                                return sets
+                        partial = next(
+                            (entry for name, entry in index.items() if pokemon in name),
+                            None,
+                        )
+                        if partial is not None:
+                            poke_name, sets = partial
+                            await self._set_cache(cache_key, sets)
+                            logger.info(
+                                f"Found sets for {pokemon} (matched {poke_name}) in {format_id}"
+                            )
+                            return sets
 
                         logger.debug(f"Pokemon {pokemon} not found in {format_id}")
                         return None
@@ -607,13 +1186,13 @@ class SmogonAPIClient:
         Returns:
             PokeAPIEVYield object or None if not found.
         """
-        pokemon = pokemon.lower().strip().replace(" ", "-")
+        pokemon = _normalize_pokemon(pokemon)
         cache_key = f"ev_yield:{pokemon}"
 
-        # Check cache first
+        # Check cache first (a negative entry means PokeAPI recently 404'd)
         cached = await self._get_cached(cache_key)
         if cached is not None:
-            return cached
+            return None if cached == _NEGATIVE_CACHE_ENTRY else cached
 
         # Deduplicate requests
         dedup_key = f"pokeapi:ev:{cache_key}"
@@ -637,14 +1216,14 @@ class SmogonAPIClient:
     ) -> Optional[PokeAPIEVYield]:
         """Internal method to fetch EV yield from PokeAPI (wrapped by circuit breaker)."""
         session = await self.get_session()
-        url = f"{POKEAPI_URL}/pokemon/{pokemon}"
+        url = _POKEAPI_POKEMON_URL + pokemon
         logger.debug(f"Fetching EV yield from PokeAPI: {url}")
 
         async with self._global_rate_limiter:
             async with self._rate_limiter:
                 async with session.get(url) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = orjson.loads(await resp.read())
                         ev_yields = {}
                         total_evs = 0
 
@@ -668,6 +1247,7 @@ class SmogonAPIClient:
                         return result
                     elif resp.status == 404:
                         logger.debug(f"Pokemon {pokemon} not found in PokeAPI")
+                        await self._set_negative_cache(cache_key)
                         return None
                     else:
                         logger.warning(f"PokeAPI error {resp.status} for {pokemon}")
@@ -693,13 +1273,13 @@ class SmogonAPIClient:
         Returns:
             PokeAPISprite object containing URL or error details.
         """
-        pokemon = pokemon.lower().strip().replace(" ", "-")
+        pokemon = _normalize_pokemon(pokemon)
         cache_key = f"sprite:{pokemon}:{shiny}:{generation}"
 
-        # Check cache first
-        cached = await self._get_cached(cache_key)
+        # Check cache first (a negative entry means PokeAPI recently 404'd)
+        cached = await self._get_cached(cache_key, SPRITE_CACHE_TIMEOUT)
         if cached is not None:
-            return cached
+            return None if cached == _NEGATIVE_CACHE_ENTRY else cached
 
         # Deduplicate requests
         dedup_key = f"pokeapi:sprite:{cache_key}"
@@ -718,126 +1298,32 @@ class SmogonAPIClient:
 
         return await self._deduplicate_request(dedup_key, _fetch)
 
-    async def _fetch_pokemon_sprite(
-        self, pokemon: str, shiny: bool, generation: int, cache_key: str
-    ) -> Optional[PokeAPISprite]:
-        """Internal method to fetch sprite from PokeAPI (wrapped by circuit breaker)."""
-        session = await self.get_session()
-        species_url = f"{POKEAPI_URL}/pokemon-species/{pokemon}"
+    async def _fetch_pokeapi_json(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        GET a PokeAPI resource under the rate limiters.
 
-        async with self._global_rate_limiter:
-            async with self._rate_limiter:
-                async with session.get(species_url) as species_resp:
-                    if species_resp.status == 200:
-                        species_data = await species_resp.json()
-                        gen_data = species_data.get("generation", {})
-                        gen_url = gen_data.get("url", "")
-
-                        try:
-                            introduced_gen = int(gen_url.rstrip("/").split("/")[-1])
-                        except (ValueError, IndexError):
-                            introduced_gen = 1
-
-                        if generation < introduced_gen:
-                            logger.debug(
-                                f"{pokemon} was introduced in Gen {introduced_gen}, "
-                                f"cannot show Gen {generation} sprite"
-                            )
-                            return {
-                                "error": "pokemon_not_in_generation",
-                                "introduced_gen": introduced_gen,
-                                "requested_gen": generation,
-                                "shiny": shiny,
-                                "generation": generation,
-                                "sprite_url": None,
-                                "name": None,
-                                "id": None,
-                            }
-                    elif species_resp.status == 404:
-                        logger.debug(f"Pokemon species {pokemon} not found in PokeAPI")
-                        return None
-                    else:
-                        # Raise to trigger circuit breaker
-                        raise aiohttp.ClientResponseError(
-                            request_info=species_resp.request_info,
-                            history=species_resp.history,
-                            status=species_resp.status,
-                        )
+        Args:
+            session: Active aiohttp session.
+            url: Resource URL.
 
-        url = f"{POKEAPI_URL}/pokemon/{pokemon}"
-        logger.debug(f"Fetching sprite from PokeAPI: {url}")
+        Returns:
+            Decoded JSON body, or None on 404.
 
+        Raises:
+            aiohttp.ClientResponseError: On any other non-200 status, so the
+                circuit breaker sees the failure.
+        """
         async with self._global_rate_limiter:
             async with self._rate_limiter:
                 async with session.get(url) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
-                        sprites = data.get("sprites", {})
-                        sprite_url = None
-
-                        gen_map = {
-                            1: "generation-i",
-                            2: "generation-ii",
-                            3: "generation-iii",
-                            4: "generation-iv",
-                            5: "generation-v",
-                            6: "generation-vi",
-                            7: "generation-vii",
-                            8: "generation-viii",
-                            9: None,
-                        }
-
-                        if generation == 9:
-                            sprite_url = sprites.get(
-                                "front_shiny" if shiny else "front_default"
-                            )
-                        else:
-                            gen_key = gen_map.get(generation)
-                            if gen_key:
-                                versions = sprites.get("versions", {})
-                                gen_sprites = versions.get(gen_key, {})
-                                game_keys = list(gen_sprites.keys())
-                                if game_keys:
-                                    for game_key in game_keys:
-                                        game_sprite = gen_sprites[game_key]
-                                        sprite_url = game_sprite.get(
-                                            "front_shiny" if shiny else "front_default"
-                                        )
-                                        if sprite_url:
-                                            break
-
-                        if not sprite_url:
-                            logger.debug(
-                                f"No sprite found for {pokemon} (shiny={shiny}, gen={generation})"
-                            )
-                            return None
-
-                        result: PokeAPISprite = {
-                            "sprite_url": sprite_url,
-                            "name": data.get("name"),
-                            "id": data.get("id"),
-                            "shiny": shiny,
-                            "generation": generation,
-                            "error": None,
-                            "introduced_gen": None,
-                            "requested_gen": None,
-                        }
-
-                        await self._set_cache(cache_key, result)
-                        logger.info(
-                            "Found sprite",
-                            extra={
-                                "pokemon": pokemon,
-                                "shiny": shiny,
-                                "generation": generation,
-                            },
-                        )
-                        return result
+                        return orjson.loads(await resp.read())
                     elif resp.status == 404:
-                        logger.debug(f"Pokemon {pokemon} not found in PokeAPI")
                         return None
                     else:
-                        logger.warning(f"PokeAPI error {resp.status} for {pokemon}")
+                        logger.warning(f"PokeAPI error {resp.status} for {url}")
                         # Raise to trigger circuit breaker
                         raise aiohttp.ClientResponseError(
                             request_info=resp.request_info,
@@ -845,24 +1331,144 @@ class SmogonAPIClient:
                             status=resp.status,
                         )
 
+    async def _fetch_pokemon_sprite(
+        self, pokemon: str, shiny: bool, generation: int, cache_key: str
+    ) -> Optional[PokeAPISprite]:
+        """
+        Internal method to fetch sprite from PokeAPI (wrapped by circuit breaker).
+
+        The species lookup (for the generation check) and the Pokemon lookup
+        (for the sprite) are independent, so both are requested concurrently.
+        The Pokemon request is cancelled if the species check rules it out.
+        """
+        session = await self.get_session()
+        species_url = _POKEAPI_SPECIES_URL + pokemon
+        url = _POKEAPI_POKEMON_URL + pokemon
+        logger.debug(f"Fetching sprite from PokeAPI: {url}")
+
+        species_task = asyncio.create_task(
+            self._fetch_pokeapi_json(session, species_url)
+        )
+        pokemon_task = asyncio.create_task(self._fetch_pokeapi_json(session, url))
+
+        async def _discard_pokemon_task() -> None:
+            pokemon_task.cancel()
+            await asyncio.gather(pokemon_task, return_exceptions=True)
+
+        try:
+            species_data = await species_task
+        except BaseException:
+            await _discard_pokemon_task()
+            raise
+
+        if species_data is None:
+            await _discard_pokemon_task()
+            logger.debug(f"Pokemon species {pokemon} not found in PokeAPI")
+            await self._set_negative_cache(cache_key, SPRITE_CACHE_TIMEOUT)
+            return None
+
+        gen_data = species_data.get("generation", {})
+        gen_url = gen_data.get("url", "")
+
+        try:
+            introduced_gen = int(gen_url.rstrip("/").split("/")[-1])
+        except (ValueError, IndexError):
+            introduced_gen = 1
+
+        if generation < introduced_gen:
+            await _discard_pokemon_task()
+            logger.debug(
+                f"{pokemon} was introduced in Gen {introduced_gen}, "
+                f"cannot show Gen {generation} sprite"
+            )
+            return {
+                "error": "pokemon_not_in_generation",
+                "introduced_gen": introduced_gen,
+                "requested_gen": generation,
+                "shiny": shiny,
+                "generation": generation,
+                "sprite_url": None,
+                "name": None,
+                "id": None,
+            }
+
+        data = await pokemon_task
+        if data is None:
+            logger.debug(f"Pokemon {pokemon} not found in PokeAPI")
+            await self._set_negative_cache(cache_key, SPRITE_CACHE_TIMEOUT)
+            return None
+
+        sprites = data.get("sprites", {})
+        sprite_url = None
+        sprite_field = "front_shiny" if shiny else "front_default"
+
+        if generation == 9:
+            sprite_url = sprites.get(sprite_field)
+        else:
+            gen_key = GEN_VERSION_KEYS.get(generation)
+            if gen_key:
+                versions = sprites.get("versions", {})
+                gen_sprites = versions.get(gen_key, {})
+                for game_key in GEN_GAME_PREFERENCE.get(generation, ()):
+                    game_sprite = gen_sprites.get(game_key)
+                    if game_sprite and (sprite_url := game_sprite.get(sprite_field)):
+                        break
+                else:
+                    # Games PokeAPI added after this table was written
+                    for game_sprite in gen_sprites.values():
+                        if sprite_url := game_sprite.get(sprite_field):
+                            break
+
+        if not sprite_url:
+            logger.debug(
+                f"No sprite found for {pokemon} (shiny={shiny}, gen={generation})"
+            )
+            return None
+
+        result: PokeAPISprite = {
+            "sprite_url": sprite_url,
+            "name": data.get("name"),
+            "id": data.get("id"),
+            "shiny": shiny,
+            "generation": generation,
+            "error": None,
+            "introduced_gen": None,
+            "requested_gen": None,
+        }
+
+        await self._set_cache(cache_key, result, SPRITE_CACHE_TIMEOUT)
+        logger.info(
+            "Found sprite",
+            extra={
+                "pokemon": pokemon,
+                "shiny": shiny,
+                "generation": generation,
+            },
+        )
+        return result
+
     async def get_all_pokemon_names(self) -> list[str]:
         """
         Fetch list of all Pokemon names for fuzzy matching.
 
-        Cached for 24 hours (longer than standard cache) since the list
-        changes infrequently.
+        Cached for POKEMON_NAMES_CACHE_TIMEOUT (longer than standard cache)
+        since the list changes infrequently.
 
         Returns:
             List of Pokemon names.
         """
         cache_key = "all_pokemon_names"
-        # Use a longer timeout for this list (24 hours)
-        # LONG_CACHE_TIMEOUT = 86400 - hardcoded logic below for now
-
-        cached = await self._get_cached(cache_key)
+        cached = await self._get_cached(cache_key, POKEMON_NAMES_CACHE_TIMEOUT)
         if cached is not None:
             return cached
 
+        # Concurrent cold-start callers share a single species-list download
+        return await self._deduplicate_request(
+            f"pokeapi:{cache_key}", self._fetch_all_pokemon_names, cache_key
+        )
+
+    async def _fetch_all_pokemon_names(self, cache_key: str) -> list[str]:
+        """Internal method to download and cache the full species name list."""
         session = await self.get_session()
         # Fetch a large limit to get all species
         url = f"{POKEAPI_URL}/pokemon-species?limit=2000"
@@ -871,11 +1477,15 @@ class SmogonAPIClient:
             async with self._global_rate_limiter:
                 async with session.get(url) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
-                        results = data.get("results", [])
-                        names = [p["name"] for p in results]
-
-                        await self._set_cache(cache_key, names)
+                        # Keep only the names; the parsed payload (and its
+                        # ~2000 unused URL strings) is dropped right away
+                        names = [
+                            p["name"]
+                            for p in orjson.loads(await resp.read()).get("results", [])
+                        ]
+                        await self._set_cache(
+                            cache_key, names, POKEMON_NAMES_CACHE_TIMEOUT
+                        )
                         logger.info(
                             f"Cached {len(names)} Pokemon names for fuzzy matching"
                         )
@@ -887,9 +1497,28 @@ class SmogonAPIClient:
             logger.error(f"Error fetching Pokemon list: {e}")
             return []
 
+    async def get_pokemon_name_set(self) -> FrozenSet[str]:
+        """
+        Get all Pokemon names as a frozenset for O(1) membership tests.
+
+        Built from the list `get_all_pokemon_names` returns and kept on the
+        client, so exact-name checks can skip fuzzy matching entirely. The set
+        is rebuilt after POKEMON_NAMES_CACHE_TIMEOUT, like the list itself.
+
+        Returns:
+            Frozenset of Pokemon names (empty if the list couldn't be fetched).
+        """
+        if not self._name_set or time.monotonic() >= self._name_set_expires_at:
+            names = await self.get_all_pokemon_names()
+            self._name_set = frozenset(names)
+            self._name_set_expires_at = time.monotonic() + POKEMON_NAMES_CACHE_TIMEOUT
+        return self._name_set
+
     async def clear_cache(self) -> None:
-        """Clear all cached data from the database."""
+        """Clear all cached data from memory and the database."""
         try:
+            self._l1_cache.clear()
+            self._name_set = frozenset()
             db = await get_database()
             await db.clear_cache()
             self.cache_hits = 0
@@ -905,14 +1534,16 @@ class SmogonAPIClient:
         Returns:
             CacheStats object containing hit rates and counts.
         """
-        total_requests = self.cache_hits + self.cache_misses
-        hit_rate = (self.cache_hits / total_requests * 100) if total_requests > 0 else 0
+        hits = self.cache_hits
+        misses = self.cache_misses
+        total_requests = hits + misses
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
 
         return {
             "size": "N/A",  # Will be fetched from DB if needed
             "max_size": MAX_CACHE_SIZE,
-            "hits": self.cache_hits,
-            "misses": self.cache_misses,
+            "hits": hits,
+            "misses": misses,
             "hit_rate": f"{hit_rate:.1f}%",
         }
 
@@ -925,7 +1556,6 @@ class SmogonAPIClient:
         """
         return {
             "pending_requests": len(self._pending_requests),
-            "active_locks": len(self._request_locks),
         }
 
     def get_circuit_breaker_stats(self) -> Dict[str, dict]:
@@ -102,8 +102,6 @@ class DeduplicationStats(TypedDict):
 
     Attributes:
         pending_requests: Number of API requests currently in flight (deduplicated).
-        active_locks: Number of locks currently held for request coordination.
     """
 
     pending_requests: int
-    active_locks: int
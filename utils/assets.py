@@ -3,92 +3,98 @@ Centralized asset registry for the bot.
 Contains emoji IDs and static assets.
 """
 
+from types import MappingProxyType
+
 # Hidden Card Emoji
 CARD_BACK_EMOJI = "<:reverse_modified:1441432178557718719>"
 
 # Custom Card Emojis
-CARD_EMOJIS = {
-    # Spades
-    "ace_spades": "<:ace_of_spades:1441431173871042750>",
-    "2_spades": "<:2_of_spades:1441430921063698503>",
-    "3_spades": "<:3_of_spades:1441430929632526377>",
-    "4_spades": "<:4_of_spades:1441430938713198704>",
-    "5_spades": "<:5_of_spades:1441430953372155995>",
-    "6_spades": "<:6_of_spades:1441430962616533023>",
-    "7_spades": "<:7_of_spades:1441430972221624471>",
-    "8_spades": "<:8_of_spades:1441430982992593047>",
-    "9_spades": "<:9_of_spades:1441430991163101244>",
-    "10_spades": "<:10_of_spades:1441431000818389095>",
-    "jack_spades": "<:jack_of_spades:1441467496224788672>",
-    "queen_spades": "<:queen_of_spades:1441467518547136776>",
-    "king_spades": "<:king_of_spades:1441467507415453736>",
-    # Hearts
-    "ace_hearts": "<:ace_of_hearts:1441431171996188702>",
-    "2_hearts": "<:2_of_hearts:1441430919331188736>",
-    "3_hearts": "<:3_of_hearts:1441430927678116005>",
-    "4_hearts": "<:4_of_hearts:1441430936611852439>",
-    "5_hearts": "<:5_of_hearts:1441430951417876560>",
-    "6_hearts": "<:6_of_hearts:1441430960007544862>",
-    "7_hearts": "<:7_of_hearts:1441430969411436594>",
-    "8_hearts": "<:8_of_hearts:1441430980446392330>",
-    "9_hearts": "<:9_of_hearts:1441430989309218897>",
-    "10_hearts": "<:10_of_hearts:1441430998398275604>",
-    "jack_hearts": "<:jack_of_hearts:1441467494660444261>",
-    "queen_hearts": "<:queen_of_hearts:1441467516252848230>",
-    "king_hearts": "<:king_of_hearts:1441467504760328202>",
-    # Diamonds
-    "ace_diamonds": "<:ace_of_diamonds:1441431170251493497>",
-    "2_diamonds": "<:2_of_diamonds:1441430917137567898>",
-    "3_diamonds": "<:3_of_diamonds:1441430924888637461>",
-    "4_diamonds": "<:4_of_diamonds:1441430933579239654>",
-    "5_diamonds": "<:5_of_diamonds:1441430949639356446>",
-    "6_diamonds": "<:6_of_diamonds:1441430957579178025>",
-    "7_diamonds": "<:7_of_diamonds:1441430967116890225>",
-    "8_diamonds": "<:8_of_diamonds:1441430977825214587>",
-    "9_diamonds": "<:9_of_diamonds:1441430987233038438>",
-    "10_diamonds": "<:10_of_diamonds:1441430996342800507>",
-    "jack_diamonds": "<:jack_of_diamonds:1441467492022095893>",
-    "queen_diamonds": "<:queen_of_diamonds:1441467513421566022>",
-    "king_diamonds": "<:king_of_diamonds:1441467502138753116>",
-    # Clubs
-    "ace_clubs": "<:ace_of_clubs:1441431168376639498>",
-    "2_clubs": "<:2_of_clubs:1441430914830962768>",
-    "3_clubs": "<:3_of_clubs:1441430922997006439>",
-    "4_clubs": "<:4_of_clubs:1441430931507511357>",
-    "5_clubs": "<:5_of_clubs:1441430947818901667>",
-    "6_clubs": "<:6_of_clubs:1441430955377033257>",
-    "7_clubs": "<:7_of_clubs:1441430964772409394>",
-    "8_clubs": "<:8_of_clubs:1441430974327033887>",
-    "9_clubs": "<:9_of_clubs:1441430984896811068>",
-    "10_clubs": "<:10_of_clubs:1441430993742462996>",
-    "jack_clubs": "<:jack_of_clubs:1441467490143047802>",
-    "queen_clubs": "<:queen_of_clubs:1441467510624092221>",
-    "king_clubs": "<:king_of_clubs:1441467499353866411>",
-    # Jokers
-    "red_joker": "<:red_joker:1441431255294935050>",
-    "black_joker": "<:black_joker:1441431281442230292>",
-}
+CARD_EMOJIS = MappingProxyType(
+    {
+        # Spades
+        "ace_spades": "<:ace_of_spades:1441431173871042750>",
+        "2_spades": "<:2_of_spades:1441430921063698503>",
+        "3_spades": "<:3_of_spades:1441430929632526377>",
+        "4_spades": "<:4_of_spades:1441430938713198704>",
+        "5_spades": "<:5_of_spades:1441430953372155995>",
+        "6_spades": "<:6_of_spades:1441430962616533023>",
+        "7_spades": "<:7_of_spades:1441430972221624471>",
+        "8_spades": "<:8_of_spades:1441430982992593047>",
+        "9_spades": "<:9_of_spades:1441430991163101244>",
+        "10_spades": "<:10_of_spades:1441431000818389095>",
+        "jack_spades": "<:jack_of_spades:1441467496224788672>",
+        "queen_spades": "<:queen_of_spades:1441467518547136776>",
+        "king_spades": "<:king_of_spades:1441467507415453736>",
+        # Hearts
+        "ace_hearts": "<:ace_of_hearts:1441431171996188702>",
+        "2_hearts": "<:2_of_hearts:1441430919331188736>",
+        "3_hearts": "<:3_of_hearts:1441430927678116005>",
+        "4_hearts": "<:4_of_hearts:1441430936611852439>",
+        "5_hearts": "<:5_of_hearts:1441430951417876560>",
+        "6_hearts": "<:6_of_hearts:1441430960007544862>",
+        "7_hearts": "<:7_of_hearts:1441430969411436594>",
+        "8_hearts": "<:8_of_hearts:1441430980446392330>",
+        "9_hearts": "<:9_of_hearts:1441430989309218897>",
+        "10_hearts": "<:10_of_hearts:1441430998398275604>",
+        "jack_hearts": "<:jack_of_hearts:1441467494660444261>",
+        "queen_hearts": "<:queen_of_hearts:1441467516252848230>",
+        "king_hearts": "<:king_of_hearts:1441467504760328202>",
+        # Diamonds
+        "ace_diamonds": "<:ace_of_diamonds:1441431170251493497>",
+        "2_diamonds": "<:2_of_diamonds:1441430917137567898>",
+        "3_diamonds": "<:3_of_diamonds:1441430924888637461>",
+        "4_diamonds": "<:4_of_diamonds:1441430933579239654>",
+        "5_diamonds": "<:5_of_diamonds:1441430949639356446>",
+        "6_diamonds": "<:6_of_diamonds:1441430957579178025>",
+        "7_diamonds": "<:7_of_diamonds:1441430967116890225>",
+        "8_diamonds": "<:8_of_diamonds:1441430977825214587>",
+        "9_diamonds": "<:9_of_diamonds:1441430987233038438>",
+        "10_diamonds": "<:10_of_diamonds:1441430996342800507>",
+        "jack_diamonds": "<:jack_of_diamonds:1441467492022095893>",
+        "queen_diamonds": "<:queen_of_diamonds:1441467513421566022>",
+        "king_diamonds": "<:king_of_diamonds:1441467502138753116>",
+        # Clubs
+        "ace_clubs": "<:ace_of_clubs:1441431168376639498>",
+        "2_clubs": "<:2_of_clubs:1441430914830962768>",
+        "3_clubs": "<:3_of_clubs:1441430922997006439>",
+        "4_clubs": "<:4_of_clubs:1441430931507511357>",
+        "5_clubs": "<:5_of_clubs:1441430947818901667>",
+        "6_clubs": "<:6_of_clubs:1441430955377033257>",
+        "7_clubs": "<:7_of_clubs:1441430964772409394>",
+        "8_clubs": "<:8_of_clubs:1441430974327033887>",
+        "9_clubs": "<:9_of_clubs:1441430984896811068>",
+        "10_clubs": "<:10_of_clubs:1441430993742462996>",
+        "jack_clubs": "<:jack_of_clubs:1441467490143047802>",
+        "queen_clubs": "<:queen_of_clubs:1441467510624092221>",
+        "king_clubs": "<:king_of_clubs:1441467499353866411>",
+        # Jokers
+        "red_joker": "<:red_joker:1441431255294935050>",
+        "black_joker": "<:black_joker:1441431281442230292>",
+    }
+)
 
 # Pokemon Type Emojis (Custom Placeholders)
 # TODO: Replace '000000000000000000' with actual emoji IDs after uploading to Discord
-TYPE_EMOJIS = {
-    "normal": "<:type_normal:1441495642202570843>",
-    "fire": "<:type_fire:1441495409980608542>",
-    "water": "<:type_water:1441495819856642120>",
-    "electric": "<:type_electric:1441495300001894465>",
-    "grass": "<:type_grass:1441495530113990666>",
-    "ice": "<:type_ice:1441495612372815902>",
-    "fighting": "<:type_fighting:1441495376220917872>",
-    "poison": "<:type_poison:1441495678705729556>",
-    "ground": "<:type_ground:1441495573596340354>",
-    "flying": "<:type_flying:1441495445376471142>",
-    "psychic": "<:type_psychic:1441495711651725363>",
-    "bug": "<:type_bug:1441495126126887033>",
-    "rock": "<:type_rock:1441495741397729312>",
-    "ghost": "<:type_ghost:1441495492855988245>",
-    "dragon": "<:type_dragon:1441495252589350922>",
-    "dark": "<:type_dark:1441495182863503471>",
-    "steel": "<:type_steel:1441495783089111060>",
-    "fairy": "<:type_fairy:1441495342498451686>",
-    "stellar": ":sparkles:",
-}
+TYPE_EMOJIS = MappingProxyType(
+    {
+        "normal": "<:type_normal:1441495642202570843>",
+        "fire": "<:type_fire:1441495409980608542>",
+        "water": "<:type_water:1441495819856642120>",
+        "electric": "<:type_electric:1441495300001894465>",
+        "grass": "<:type_grass:1441495530113990666>",
+        "ice": "<:type_ice:1441495612372815902>",
+        "fighting": "<:type_fighting:1441495376220917872>",
+        "poison": "<:type_poison:1441495678705729556>",
+        "ground": "<:type_ground:1441495573596340354>",
+        "flying": "<:type_flying:1441495445376471142>",
+        "psychic": "<:type_psychic:1441495711651725363>",
+        "bug": "<:type_bug:1441495126126887033>",
+        "rock": "<:type_rock:1441495741397729312>",
+        "ghost": "<:type_ghost:1441495492855988245>",
+        "dragon": "<:type_dragon:1441495252589350922>",
+        "dark": "<:type_dark:1441495182863503471>",
+        "steel": "<:type_steel:1441495783089111060>",
+        "fairy": "<:type_fairy:1441495342498451686>",
+        "stellar": ":sparkles:",
+    }
+)
@@ -9,25 +9,64 @@ shuffled decks used in the game. It supports:
 """
 
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 
-from config.settings import BLACKJACK_NUM_DECKS_IN_SHOE
+from config.settings import (
+    BLACKJACK_ACE_HIGH_VALUE,
+    BLACKJACK_FACE_CARD_VALUE,
+    BLACKJACK_NUM_DECKS_IN_SHOE,
+)
 from utils.assets import CARD_EMOJIS
 
-
-@dataclass
+# Suit/rank symbols to the names used in CARD_EMOJIS keys (e.g., 'ace_spades')
+_SUIT_NAMES = {"♠": "spades", "♥": "hearts", "♦": "diamonds", "♣": "clubs"}
+_RANK_NAMES = {"A": "ace", "J": "jack", "Q": "queen", "K": "king"}
+# Rank order within a suit; rank_id is the index into this
+_RANK_ORDER = ("A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K")
+_RANK_IDS = {rank: rank_id for rank_id, rank in enumerate(_RANK_ORDER)}
+# Blackjack values for non-numeric ranks (Aces count high until a hand busts)
+_RANK_VALUES = {
+    "A": BLACKJACK_ACE_HIGH_VALUE,
+    "J": BLACKJACK_FACE_CARD_VALUE,
+    "Q": BLACKJACK_FACE_CARD_VALUE,
+    "K": BLACKJACK_FACE_CARD_VALUE,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Card:
     """
     Represents a standard playing card.
 
+    Immutable, so a single instance can be shared by every deck in a shoe.
+
     Attributes:
         suit: The card suit (♠, ♥, ♦, ♣).
         rank: The card rank (A, 2-10, J, Q, K).
+        bj_value: Blackjack value of the card (2-10, or 11 for Ace).
+        is_ace: Whether the card is an Ace.
+        rank_id: Position of the rank in A-K order (0-12), for cheap comparisons.
     """
 
     suit: str
     rank: str
+    bj_value: int = field(init=False, repr=False, compare=False)
+    rank_id: int = field(init=False, repr=False, compare=False)
+    is_ace: bool = field(init=False, repr=False, compare=False)
+    _text: str = field(init=False, repr=False, compare=False)
+    _emoji: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve the value and display strings once, since cards never change."""
+        bj_value = _RANK_VALUES.get(self.rank) or int(self.rank)
+        object.__setattr__(self, "bj_value", bj_value)
+        object.__setattr__(self, "is_ace", self.rank == "A")
+        object.__setattr__(self, "rank_id", _RANK_IDS.get(self.rank, -1))
+        text = f"{self.rank}{self.suit}"
+        object.__setattr__(self, "_text", text)
+        emoji = _CARD_EMOJI_TABLE.get((self.suit, self.rank)) or text
+        object.__setattr__(self, "_emoji", emoji)
 
     def __str__(self) -> str:
         """
@@ -36,7 +75,7 @@ class Card:
         Returns:
             String representation.
         """
-        return f"{self.rank}{self.suit}"
+        return self._text
 
     def get_emoji(self) -> str:
         """
@@ -48,19 +87,7 @@ class Card:
         Returns:
             Discord emoji string or text fallback.
         """
-        # Map suit symbols to names
-        suit_map = {"♠": "spades", "♥": "hearts", "♦": "diamonds", "♣": "clubs"}
-
-        # Map rank symbols to names
-        rank_map = {"A": "ace", "J": "jack", "Q": "queen", "K": "king"}
-
-        suit_name = suit_map.get(self.suit, "spades")
-        rank_name = rank_map.get(self.rank, self.rank)
-
-        key = f"{rank_name}_{suit_name}"
-
-        # Return emoji or fallback to text if missing
-        return CARD_EMOJIS.get(key, str(self))
+        return self._emoji
 
     @property
     def value(self) -> int:
@@ -74,12 +101,7 @@ class Card:
         Returns:
             Integer value (2-10, or 11 for Ace).
         """
-        if self.rank == "A":
-            return 11
-        elif self.rank in ["J", "Q", "K"]:
-            return 10
-        else:
-            return int(self.rank)
+        return self.bj_value
 
 
 class Deck:
@@ -91,7 +113,7 @@ class Deck:
     """
 
     SUITS = ["♠", "♥", "♦", "♣"]
-    RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+    RANKS = list(_RANK_ORDER)
 
     def __init__(self, seed: int = None):
         """
@@ -101,21 +123,27 @@ class Deck:
             seed: Optional random seed for reproducible shuffling (useful for testing).
         """
         self.seed = seed or random.randint(1, 1000000)
+        # Per-deck RNG so concurrent games never touch the global random state
+        self._rng = random.Random(self.seed)
         self.cards: List[Card] = []
         self._initialize_decks()
         self._shuffle()
 
+        # Cards at indices [0, _idx) are still in the shoe; draws move it down
+        self._idx = len(self.cards)
+
     def _initialize_decks(self):
-        """Create multiple standard decks based on configuration."""
-        for _ in range(BLACKJACK_NUM_DECKS_IN_SHOE):
-            for suit in self.SUITS:
-                for rank in self.RANKS:
-                    self.cards.append(Card(suit=suit, rank=rank))
+        """
+        Create multiple standard decks based on configuration.
+
+        Cards are never mutated, so every deck in the shoe shares the Card
+        objects of one prebuilt 52-card template.
+        """
+        self.cards = list(_TEMPLATE_DECK * BLACKJACK_NUM_DECKS_IN_SHOE)
 
     def _shuffle(self):
         """Shuffle the deck using the configured seed."""
-        random.seed(self.seed)
-        random.shuffle(self.cards)
+        self._rng.shuffle(self.cards)
 
     def draw(self) -> Card:
         """
@@ -127,19 +155,63 @@ class Deck:
         Raises:
             IndexError: If the deck is empty.
         """
-        if not self.cards:
+        if self._idx == 0:
             raise IndexError("Deck is empty - no more cards to draw")
 
-        return self.cards.pop()
+        self._idx -= 1
+        return self.cards[self._idx]
+
+    def draw_many(self, count: int) -> List[Card]:
+        """
+        Draw several cards from the top of the deck at once.
+
+        Cards come back in the same order repeated `draw()` calls would return.
+
+        Args:
+            count: Number of cards to draw.
+
+        Returns:
+            List of the drawn Card objects.
+
+        Raises:
+            IndexError: If fewer than `count` cards remain.
+        """
+        if count > self._idx:
+            raise IndexError(f"Deck has {self._idx} cards left - cannot draw {count}")
+
+        start = self._idx - count
+        drawn = self.cards[start : self._idx]
+        drawn.reverse()
+        self._idx = start
+        return drawn
+
+    def reset(self) -> None:
+        """Return every drawn card to the shoe and reshuffle it."""
+        self._shuffle()
+        self._idx = len(self.cards)
 
     def cards_remaining(self) -> int:
         """Get number of cards remaining in the shoe."""
-        return len(self.cards)
+        return self._idx
 
     def __len__(self) -> int:
         """Return number of cards in deck."""
-        return len(self.cards)
+        return self._idx
 
     def __repr__(self) -> str:
         """String representation of deck status."""
-        return f"<Deck: {len(self.cards)} cards remaining, seed={self.seed}>"
+        return f"<Deck: {self._idx} cards remaining, seed={self.seed}>"
+
+
+# (suit, rank) -> Discord emoji, resolved once per Card at construction
+_CARD_EMOJI_TABLE = {
+    (suit, rank): CARD_EMOJIS[key]
+    for suit, suit_name in _SUIT_NAMES.items()
+    for rank in Deck.RANKS
+    if (key := f"{_RANK_NAMES.get(rank, rank)}_{suit_name}") in CARD_EMOJIS
+}
+
+# One standard 52-card deck, built once at import and shared by every shoe
+_TEMPLATE_DECK = tuple(
+    Card(suit=suit, rank=rank) for suit in Deck.SUITS for rank in Deck.RANKS
+)
@@ -14,18 +14,17 @@ It handles:
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from config.settings import (
+    BLACKJACK_ACE_HIGH_VALUE,
+    BLACKJACK_ACE_LOW_VALUE,
     BLACKJACK_INITIAL_CARDS_COUNT,
+    BLACKJACK_VALUE,
 )
 from utils.blackjack_deck import Card, Deck
 from utils.blackjack_helpers import (
-    calculate_hand_value,
     can_split,
-    is_blackjack,
-    is_bust,
-    is_soft_hand,
 )
 
 logger = logging.getLogger("smogon_bot.blackjack")
@@ -55,7 +54,16 @@ class HandStatus(Enum):
     SURRENDER = "surrender"  # Player surrendered (late surrender)
 
 
-@dataclass
+# Status/phase groupings checked on every action, built once
+_COMPETITIVE_STATUSES = frozenset(
+    {HandStatus.ACTIVE, HandStatus.STAND, HandStatus.BLACKJACK, HandStatus.SPLIT_ACES}
+)  # Hands that can still beat the dealer
+_DEALER_FINISHED_STATUSES = frozenset({HandStatus.BUST, HandStatus.STAND})
+_REVEAL_PHASES = frozenset({GamePhase.DEALER_TURN, GamePhase.RESULTS})  # Hole card up
+_TERMINAL_PHASES = frozenset({GamePhase.RESULTS, GamePhase.ENDED})
+
+
+@dataclass(slots=True)
 class PlayerHand:
     """
     Represents a specific hand held by a player.
@@ -67,15 +75,83 @@ class PlayerHand:
         status: Current status of the hand (Active, Bust, Stand, etc.).
         is_split: Whether this hand resulted from a split.
         is_split_aces: Whether this hand resulted from splitting Aces (special rules apply).
+        total: Running best value of the hand, kept in sync by `add_card`.
+        aces_high: Number of Aces currently counted as 11 in `total`.
     """
 
     cards: List[Card] = field(default_factory=list)
     status: HandStatus = HandStatus.ACTIVE
     is_split: bool = False
     is_split_aces: bool = False
+    total: int = field(default=0, init=False)
+    aces_high: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        initial_cards, self.cards = self.cards, []
+        self.add_cards(initial_cards)
+
+    def add_card(self, card: Card) -> None:
+        """
+        Add a card to the hand and update the running total.
 
+        Aces are counted as 11 when added and demoted to 1 only while the
+        hand would otherwise bust, so `total` always matches
+        `calculate_hand_value(cards)`.
 
-@dataclass
+        Args:
+            card: Card to add.
+        """
+        self.cards.append(card)
+        self.total += card.bj_value
+        if card.is_ace:
+            self.aces_high += 1
+
+        while self.total > BLACKJACK_VALUE and self.aces_high:
+            self.total -= BLACKJACK_ACE_HIGH_VALUE - BLACKJACK_ACE_LOW_VALUE
+            self.aces_high -= 1
+
+    def add_cards(self, cards: List[Card]) -> None:
+        """
+        Add several cards to the hand, adjusting Aces once at the end.
+
+        Args:
+            cards: Cards to add.
+        """
+        self.cards.extend(cards)
+        for card in cards:
+            self.total += card.bj_value
+            if card.is_ace:
+                self.aces_high += 1
+
+        while self.total > BLACKJACK_VALUE and self.aces_high:
+            self.total -= BLACKJACK_ACE_HIGH_VALUE - BLACKJACK_ACE_LOW_VALUE
+            self.aces_high -= 1
+
+    @property
+    def value(self) -> int:
+        """Best numerical value of the hand."""
+        return self.total
+
+    @property
+    def is_soft(self) -> bool:
+        """Whether the hand holds an Ace counted as 11."""
+        return self.aces_high > 0
+
+    @property
+    def is_bust(self) -> bool:
+        """Whether the hand exceeds 21."""
+        return self.total > BLACKJACK_VALUE
+
+    @property
+    def is_blackjack(self) -> bool:
+        """Whether the hand is exactly 2 cards totaling 21."""
+        return (
+            len(self.cards) == BLACKJACK_INITIAL_CARDS_COUNT
+            and self.total == BLACKJACK_VALUE
+        )
+
+
+@dataclass(slots=True)
 class Player:
     """
     Represents a participant in the game (User or Dealer).
@@ -93,6 +169,16 @@ class Player:
     hands: List[PlayerHand] = field(default_factory=lambda: [PlayerHand()])
     is_dealer: bool = False
     current_hand_index: int = 0
+    _active_count: int = field(init=False, repr=False, compare=False)
+    _competitive_count: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._active_count = sum(
+            hand.status == HandStatus.ACTIVE for hand in self.hands
+        )
+        self._competitive_count = sum(
+            hand.status in _COMPETITIVE_STATUSES for hand in self.hands
+        )
 
     def get_current_hand(self) -> PlayerHand:
         """
@@ -109,7 +195,68 @@ class Player:
 
     def all_hands_finished(self) -> bool:
         """Check if all of the player's hands have finished playing."""
-        return all(hand.status != HandStatus.ACTIVE for hand in self.hands)
+        return self._active_count == 0
+
+    def has_competitive_hand(self) -> bool:
+        """Check if any of the player's hands can still beat the dealer."""
+        return self._competitive_count > 0
+
+    def set_hand_status(self, hand: PlayerHand, status: HandStatus) -> None:
+        """
+        Change the status of one of the player's hands.
+
+        All status changes go through here so the counts of still-active
+        and still-competitive hands stay in sync with the hands themselves.
+
+        Args:
+            hand: One of this player's hands.
+            status: The new status.
+        """
+        if hand.status == HandStatus.ACTIVE and status != HandStatus.ACTIVE:
+            self._active_count -= 1
+        self._competitive_count += (status in _COMPETITIVE_STATUSES) - (
+            hand.status in _COMPETITIVE_STATUSES
+        )
+        hand.status = status
+
+    def split_current_hand(self, hand1: PlayerHand, hand2: PlayerHand) -> None:
+        """
+        Replace the (active) current hand with the two hands of a split.
+
+        Args:
+            hand1: Hand taking the current hand's place.
+            hand2: Hand inserted right after it.
+        """
+        self.hands[self.current_hand_index] = hand1
+        self.hands.insert(self.current_hand_index + 1, hand2)
+        self._active_count += 1
+        self._competitive_count += 1
+
+
+@dataclass(frozen=True, slots=True)
+class ActionResult:
+    """
+    Outcome of a card-drawing action (Hit or Double Down).
+
+    Truthy when the action succeeded, so callers can keep testing it directly.
+
+    Attributes:
+        success: Whether the action was accepted.
+        card: The card drawn, if any.
+        bust: Whether the hand busted with this card.
+        hand_finished: Whether the hand can no longer act (bust, stand, doubled).
+    """
+
+    success: bool
+    card: Optional[Card] = None
+    bust: bool = False
+    hand_finished: bool = False
+
+    def __bool__(self) -> bool:
+        return self.success
+
+
+_REJECTED = ActionResult(success=False)  # Shared result for invalid actions
 
 
 class BlackjackGame:
@@ -151,9 +298,15 @@ class BlackjackGame:
         self.dealer = Player(user_id=dealer_id, username=dealer_name, is_dealer=True)
 
         self.players: List[Player] = []
+        self._player_by_id: Dict[int, Player] = {}  # Lobby membership index
+        self._turn_order: Optional[Tuple[Player, ...]] = None  # Fixed at game start
         self.deck = Deck()
-        self.phase = GamePhase.LOBBY
-        self.current_turn_index = 0
+        self._current_player: Optional[Player] = None  # Set by the phase/turn setters
+        self._phase = GamePhase.LOBBY
+        self._current_turn_index = 0
+        self._reveal_hole_card = False  # Derived from phase by its setter
+        self._game_over = False  # Derived from phase by its setter
+        self._hand_line_cache: Dict[tuple, str] = {}  # Rendered hand text for embeds
 
         logger.info(
             "Blackjack game created",
@@ -166,6 +319,40 @@ class BlackjackGame:
             },
         )
 
+    @property
+    def phase(self) -> GamePhase:
+        """Current game phase."""
+        return self._phase
+
+    @phase.setter
+    def phase(self, value: GamePhase) -> None:
+        self._phase = value
+        self._reveal_hole_card = value in _REVEAL_PHASES
+        self._game_over = value in _TERMINAL_PHASES
+        self._update_current_player()
+
+    @property
+    def current_turn_index(self) -> int:
+        """Index into `players` of the player whose turn it is."""
+        return self._current_turn_index
+
+    @current_turn_index.setter
+    def current_turn_index(self, value: int) -> None:
+        self._current_turn_index = value
+        self._update_current_player()
+
+    def _update_current_player(self) -> None:
+        """Recompute whose turn it is after the phase or turn index changes."""
+        if self._phase == GamePhase.DEALER_TURN:
+            self._current_player = self.dealer
+        elif (
+            self._phase == GamePhase.PLAYING
+            and 0 <= self._current_turn_index < len(self.players)
+        ):
+            self._current_player = self.players[self._current_turn_index]
+        else:
+            self._current_player = None
+
     def toggle_style(self) -> bool:
         """
         Toggle between Emoji and Text display modes.
@@ -198,7 +385,7 @@ class BlackjackGame:
             return False
 
         # Check if already joined
-        if any(p.user_id == user_id for p in self.players):
+        if user_id in self._player_by_id:
             logger.warning(f"Player {username} already in game")
             return False
 
@@ -209,6 +396,7 @@ class BlackjackGame:
 
         player = Player(user_id=user_id, username=username)
         self.players.append(player)
+        self._player_by_id[user_id] = player
 
         logger.info(
             "Player joined game",
@@ -233,7 +421,9 @@ class BlackjackGame:
         if self.phase != GamePhase.LOBBY:
             return False
 
-        self.players = [p for p in self.players if p.user_id != user_id]
+        player = self._player_by_id.pop(user_id, None)
+        if player is not None:
+            self.players.remove(player)
         logger.info(f"Player {user_id} left game")
         return True
 
@@ -265,37 +455,30 @@ class BlackjackGame:
             return False
 
         self.phase = GamePhase.DEALING
+        self._turn_order = (*self.players, self.dealer)
         logger.info(f"Starting game with {len(self.players)} player(s)")
 
         # Deal initial cards
         self._deal_initial_cards()
 
         # Check for dealer blackjack (game ends immediately)
-        if is_blackjack(self.dealer.hands[0].cards):
+        if self.dealer.hands[0].is_blackjack:
             logger.info("Dealer has blackjack - game ends immediately")
-            self.dealer.hands[0].status = HandStatus.BLACKJACK
+            self.dealer.set_hand_status(self.dealer.hands[0], HandStatus.BLACKJACK)
             self.phase = GamePhase.RESULTS
             return True
 
         # Check for player blackjacks (they auto-stand/win, but game continues for others)
         for player in self.players:
-            if is_blackjack(player.hands[0].cards):
+            if player.hands[0].is_blackjack:
                 logger.info(f"Player {player.username} has blackjack - auto-stand")
-                player.hands[0].status = HandStatus.BLACKJACK
+                player.set_hand_status(player.hands[0], HandStatus.BLACKJACK)
 
         # Move to playing phase
         self.phase = GamePhase.PLAYING
-        self.current_turn_index = 0
 
         # Fast-forward turn if the first players have Blackjack (are already finished)
-        while (
-            self.current_turn_index < len(self.players)
-            and self.players[self.current_turn_index].all_hands_finished()
-        ):
-            logger.info(
-                f"Skipping {self.players[self.current_turn_index].username} (Hands finished)"
-            )
-            self.current_turn_index += 1
+        self._skip_finished_players(0)
 
         # If everyone had Blackjack, move straight to Dealer
         if self.current_turn_index >= len(self.players):
@@ -309,36 +492,26 @@ class BlackjackGame:
 
     def _deal_initial_cards(self):
         """
-        Deal 2 cards to each player and dealer in round-robin fashion.
+        Deal 2 cards to each player, then 2 to the dealer.
 
-        Standard dealing procedure:
-        1. Card 1 to Player 1, Player 2... Dealer (Face Up)
-        2. Card 2 to Player 1, Player 2... Dealer (Hole Card/Face Down)
+        Each hand takes its cards in one draw rather than round-robin. From a
+        properly shuffled shoe both orders give every hand the same odds, and
+        the hole card is purely presentational (see `should_reveal_hole_card`):
+        the dealer's second card stays hidden during player turns.
         """
         logger.info(
             "Dealing initial cards",
             extra={"player_count": len(self.players), "deck_size": len(self.deck)},
         )
 
-        # Round 1
         for player in self.players:
-            card = self.deck.draw()
-            player.hands[0].cards.append(card)
-            logger.debug(f"Dealt {card} to {player.username}")
-
-        dealer_card_1 = self.deck.draw()
-        self.dealer.hands[0].cards.append(dealer_card_1)
-        logger.debug(f"Dealt {dealer_card_1} to dealer (face up)")
+            hand = player.hands[0]
+            hand.add_cards(self.deck.draw_many(BLACKJACK_INITIAL_CARDS_COUNT))
+            logger.debug("Dealt %s to %s", hand.cards, player.username)
 
-        # Round 2
-        for player in self.players:
-            card = self.deck.draw()
-            player.hands[0].cards.append(card)
-            logger.debug(f"Dealt {card} to {player.username}")
-
-        dealer_card_2 = self.deck.draw()
-        self.dealer.hands[0].cards.append(dealer_card_2)
-        logger.debug(f"Dealt {dealer_card_2} to dealer (face down - hole card)")
+        dealer_hand = self.dealer.hands[0]
+        dealer_hand.add_cards(self.deck.draw_many(BLACKJACK_INITIAL_CARDS_COUNT))
+        logger.debug("Dealt %s to dealer (last card face down)", dealer_hand.cards)
 
     # ==================== TURN MANAGEMENT ====================
 
@@ -349,22 +522,16 @@ class BlackjackGame:
         Returns:
             Player object or None if not in a playing phase.
         """
-        if self.phase == GamePhase.DEALER_TURN:
-            return self.dealer
-
-        if self.phase != GamePhase.PLAYING:
-            return None
-
-        if 0 <= self.current_turn_index < len(self.players):
-            return self.players[self.current_turn_index]
-
-        return None
+        return self._current_player
 
-    def get_turn_order(self) -> List[Player]:
+    def get_turn_order(self) -> Tuple[Player, ...]:
         """Get the full list of participants in turn order."""
-        return self.players + [self.dealer]
+        if self._turn_order is None:
+            # Still in the lobby - the order isn't fixed yet
+            return (*self.players, self.dealer)
+        return self._turn_order
 
-    def _check_all_players_busted_or_surrendered(self) -> bool:
+    def all_players_busted_or_surrendered(self) -> bool:
         """
         Check if every non-dealer player has busted or surrendered.
         If true, the dealer does not need to play out their hand.
@@ -375,18 +542,28 @@ class BlackjackGame:
         if not self.players:
             return False
 
-        for player in self.players:
-            # Check if player has ANY hand that's still potentially competitive
-            for hand in player.hands:
-                if hand.status in [
-                    HandStatus.ACTIVE,
-                    HandStatus.STAND,
-                    HandStatus.BLACKJACK,
-                    HandStatus.SPLIT_ACES,
-                ]:
-                    return False
+        # Check if any player has a hand that's still potentially competitive
+        return not any(player.has_competitive_hand() for player in self.players)
 
-        return True
+    def _skip_finished_players(self, start: int) -> None:
+        """
+        Point the turn at the first player from `start` with a hand left to play.
+
+        Leaves `current_turn_index` at `len(players)` if every remaining
+        player has finished, which callers treat as the dealer's turn.
+
+        Args:
+            start: Index of the first player to consider.
+        """
+        players = self.players
+        self.current_turn_index = next(
+            (
+                i
+                for i in range(start, len(players))
+                if not players[i].all_hands_finished()
+            ),
+            len(players),
+        )
 
     def _advance_turn(self):
         """
@@ -401,61 +578,58 @@ class BlackjackGame:
         """
         current_player = self.get_current_player()
 
-        if current_player and not current_player.all_hands_finished():
-            # Still has hands to play
-            if current_player.current_hand_index < len(current_player.hands) - 1:
-                current_player.current_hand_index += 1
-
-                # SEQUENTIAL SPLIT LOGIC:
-                # If we move to a split hand that only has 1 card, deal the second card now
-                current_hand = current_player.get_current_hand()
-                if len(current_hand.cards) == 1:
-                    new_card = self.deck.draw()
-                    current_hand.cards.append(new_card)
-                    logger.info(
-                        f"Dealt second card to {current_player.username}'s split hand: {new_card}"
-                    )
-
-                    # Handle Aces specifically if split (usually you only get one card)
-                    if current_hand.is_split_aces:
-                        current_hand.status = HandStatus.SPLIT_ACES
-                        # Recursively advance since this hand is now done
-                        self._advance_turn()
-                        return
-
+        # Still has hands to play (loops past split-Ace hands, which finish on deal)
+        while (
+            current_player
+            and not current_player.all_hands_finished()
+            and current_player.current_hand_index < len(current_player.hands) - 1
+        ):
+            current_player.current_hand_index += 1
+
+            # SEQUENTIAL SPLIT LOGIC:
+            # If we move to a split hand that only has 1 card, deal the second card now
+            current_hand = current_player.get_current_hand()
+            if len(current_hand.cards) == 1:
+                new_card = self.deck.draw()
+                current_hand.add_card(new_card)
                 logger.info(
-                    f"Moving to {current_player.username}'s next hand "
-                    f"({current_player.current_hand_index + 1}/{len(current_player.hands)})"
+                    "Dealt second card to %s's split hand: %s",
+                    current_player.username,
+                    new_card,
                 )
-                return
+
+                # Handle Aces specifically if split (usually you only get one card)
+                if current_hand.is_split_aces:
+                    current_player.set_hand_status(current_hand, HandStatus.SPLIT_ACES)
+                    # This hand is now done - keep advancing
+                    continue
+
+            logger.info(
+                "Moving to %s's next hand (%d/%d)",
+                current_player.username,
+                current_player.current_hand_index + 1,
+                len(current_player.hands),
+            )
+            return
 
         # Check if current player is dealer and has finished (bust or stand)
         if current_player and current_player.is_dealer:
-            if current_player.get_current_hand().status in [
-                HandStatus.BUST,
-                HandStatus.STAND,
-            ]:
+            dealer_status = current_player.get_current_hand().status
+            if dealer_status in _DEALER_FINISHED_STATUSES:
                 logger.info("Dealer finished (bust or stand) - moving to results")
                 self.phase = GamePhase.RESULTS
                 return
 
         # Check if all players have busted or surrendered (Dealer doesn't need to play)
-        if self._check_all_players_busted_or_surrendered():
+        if self.all_players_busted_or_surrendered():
             logger.info(
                 "All players busted/surrendered - dealer wins automatically, skipping dealer turn"
             )
             self.phase = GamePhase.RESULTS
             return
 
-        # Move to next player
-        self.current_turn_index += 1
-
-        # Skip players who finished all hands (e.g., immediate Blackjack)
-        while (
-            self.current_turn_index < len(self.players)
-            and self.players[self.current_turn_index].all_hands_finished()
-        ):
-            self.current_turn_index += 1
+        # Move to next player, skipping those who finished all hands (e.g., Blackjack)
+        self._skip_finished_players(self.current_turn_index + 1)
 
         # If all players done, move to dealer
         if self.current_turn_index >= len(self.players):
@@ -465,7 +639,7 @@ class BlackjackGame:
             self._check_dealer_auto_stand()
         else:
             logger.info(
-                f"Moving to {self.players[self.current_turn_index].username}'s turn"
+                "Moving to %s's turn", self.players[self.current_turn_index].username
             )
 
     def _check_dealer_auto_stand(self):
@@ -482,8 +656,8 @@ class BlackjackGame:
             return
 
         dealer_hand = self.dealer.hands[0]
-        hand_value = calculate_hand_value(dealer_hand.cards)
-        is_soft = is_soft_hand(dealer_hand.cards)
+        hand_value = dealer_hand.total
+        is_soft = dealer_hand.is_soft
 
         # Dealer must HIT on 16 or lower
         if hand_value < 17:
@@ -494,70 +668,106 @@ class BlackjackGame:
             return False
 
         # Otherwise, Dealer STANDS (Hard 17+ or Soft 18+)
-        dealer_hand.status = HandStatus.STAND
+        self.dealer.set_hand_status(dealer_hand, HandStatus.STAND)
         self.phase = GamePhase.RESULTS
         logger.info(
-            f"Dealer auto-stand at {hand_value} (Soft: {is_soft}) - moving to results"
+            "Dealer auto-stand at %d (Soft: %s) - moving to results",
+            hand_value,
+            is_soft,
         )
         return True
 
     # ==================== PLAYER ACTIONS ====================
 
-    def hit(self, user_id: int) -> Optional[Card]:
+    def _validate_player_action(
+        self, user_id: int, action: str, allow_dealer: bool = False
+    ) -> Optional[Tuple[Player, PlayerHand]]:
         """
-        Perform 'Hit' action: Draw one card.
+        Run the checks shared by every action.
+
+        The user must be the current player, the dealer must be allowed to take
+        the action, and the current hand must still be active.
 
         Args:
             user_id: ID of the user performing the action.
+            action: Action name, used in log messages.
+            allow_dealer: Whether the dealer may take this action.
 
         Returns:
-            The drawn Card, or None if the action is invalid.
+            Tuple of (current player, current hand), or None if the action is invalid.
         """
-        current_player = self.get_current_player()
+        current_player = self._current_player
 
-        if not current_player or current_player.user_id != user_id:
-            logger.warning(f"Hit failed - not {user_id}'s turn")
+        if current_player is None or current_player.user_id != user_id:
+            logger.warning("%s failed - not %s's turn", action, user_id)
             return None
 
-        # Dealer-specific: check if can hit (H17 Logic)
-        if current_player.is_dealer:
-            if self.can_dealer_stand():
-                logger.warning("Dealer cannot hit (must stand)")
-                return None
+        if current_player.is_dealer and not allow_dealer:
+            logger.warning("Dealer cannot %s", action)
+            return None
 
-        current_hand = current_player.get_current_hand()
+        current_hand = current_player.hands[current_player.current_hand_index]
 
         if current_hand.status != HandStatus.ACTIVE:
-            logger.warning(f"Cannot hit - hand already {current_hand.status}")
+            logger.warning("Cannot %s - hand already %s", action, current_hand.status)
             return None
 
+        return current_player, current_hand
+
+    def hit(self, user_id: int) -> ActionResult:
+        """
+        Perform 'Hit' action: Draw one card.
+
+        Args:
+            user_id: ID of the user performing the action.
+
+        Returns:
+            ActionResult with the drawn card; falsy if the action is invalid.
+        """
+        validated = self._validate_player_action(user_id, "hit", allow_dealer=True)
+        if validated is None:
+            return _REJECTED
+        current_player, current_hand = validated
+
+        # Dealer-specific: check if can hit (H17 Logic)
+        if current_player.is_dealer:
+            if self.can_dealer_stand():
+                logger.warning("Dealer cannot hit (must stand)")
+                return _REJECTED
+
         # Draw card
         card = self.deck.draw()
-        current_hand.cards.append(card)
+        current_hand.add_card(card)
 
-        logger.info(
-            "Player hit",
-            extra={
-                "player": current_player.username,
-                "user_id": current_player.user_id,
-                "card": str(card),
-                "hand_value": calculate_hand_value(current_hand.cards),
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Player hit",
+                extra={
+                    "player": current_player.username,
+                    "user_id": current_player.user_id,
+                    "card": str(card),
+                    "hand_value": current_hand.total,
+                },
+            )
 
         # Check for bust
-        if is_bust(current_hand.cards):
-            current_hand.status = HandStatus.BUST
-            logger.info(f"{current_player.username} bust!")
+        if current_hand.is_bust:
+            current_player.set_hand_status(current_hand, HandStatus.BUST)
+            logger.info("%s bust!", current_player.username)
             self._advance_turn()
         # Check if dealer should auto-stand after hitting
         elif current_player.is_dealer:
             if self.can_dealer_stand():
-                current_hand.status = HandStatus.STAND
+                current_player.set_hand_status(current_hand, HandStatus.STAND)
                 self.phase = GamePhase.RESULTS
                 logger.info("Dealer auto-stand after hit - moving to results")
 
-        return card
+        return ActionResult(
+            success=True,
+            card=card,
+            bust=current_hand.is_bust,
+            hand_finished=current_hand.status != HandStatus.ACTIVE,
+        )
 
     def stand(self, user_id: int) -> bool:
         """
@@ -569,11 +779,10 @@ class BlackjackGame:
         Returns:
             True if successful, False if invalid.
         """
-        current_player = self.get_current_player()
-
-        if not current_player or current_player.user_id != user_id:
-            logger.warning(f"Stand failed - not {user_id}'s turn")
+        validated = self._validate_player_action(user_id, "stand", allow_dealer=True)
+        if validated is None:
             return False
+        current_player, current_hand = validated
 
         # Dealer-specific: check if can stand (H17 Logic)
         if current_player.is_dealer:
@@ -581,14 +790,8 @@ class BlackjackGame:
                 logger.warning("Dealer cannot stand (must hit on Soft 17 or < 17)")
                 return False
 
-        current_hand = current_player.get_current_hand()
-
-        if current_hand.status != HandStatus.ACTIVE:
-            logger.warning(f"Cannot stand - hand already {current_hand.status}")
-            return False
-
-        current_hand.status = HandStatus.STAND
-        logger.info(f"{current_player.username} stands")
+        current_player.set_hand_status(current_hand, HandStatus.STAND)
+        logger.info("%s stands", current_player.username)
 
         # If dealer stands, move to results
         if current_player.is_dealer:
@@ -599,7 +802,7 @@ class BlackjackGame:
 
         return True
 
-    def double_down(self, user_id: int) -> Optional[Card]:
+    def double_down(self, user_id: int) -> ActionResult:
         """
         Perform 'Double Down' action: Double bet (conceptually), draw 1 card, stand.
 
@@ -607,42 +810,35 @@ class BlackjackGame:
             user_id: ID of the user performing the action.
 
         Returns:
-            The drawn Card, or None if action invalid.
+            ActionResult with the drawn card; falsy if the action is invalid.
         """
-        current_player = self.get_current_player()
-
-        if not current_player or current_player.user_id != user_id:
-            return None
-
-        if current_player.is_dealer:
-            logger.warning("Dealer cannot double down")
-            return None
-
-        current_hand = current_player.get_current_hand()
+        validated = self._validate_player_action(user_id, "double down")
+        if validated is None:
+            return _REJECTED
+        current_player, current_hand = validated
 
         # Can only double on first 2 cards OR after split
         if len(current_hand.cards) != BLACKJACK_INITIAL_CARDS_COUNT:
             logger.warning("Can only double down on 2 cards")
-            return None
-
-        if current_hand.status != HandStatus.ACTIVE:
-            return None
+            return _REJECTED
 
         # Draw exactly one card
         card = self.deck.draw()
-        current_hand.cards.append(card)
+        current_hand.add_card(card)
 
-        logger.info(f"{current_player.username} doubled down - drew {card}")
+        logger.info("%s doubled down - drew %s", current_player.username, card)
 
         # Check for bust
-        if is_bust(current_hand.cards):
-            current_hand.status = HandStatus.BUST
-            logger.info(f"{current_player.username} bust after double down!")
+        if current_hand.is_bust:
+            current_player.set_hand_status(current_hand, HandStatus.BUST)
+            logger.info("%s bust after double down!", current_player.username)
         else:
-            current_hand.status = HandStatus.STAND
+            current_player.set_hand_status(current_hand, HandStatus.STAND)
 
         self._advance_turn()
-        return card
+        return ActionResult(
+            success=True, card=card, bust=current_hand.is_bust, hand_finished=True
+        )
 
     def split(self, user_id: int) -> bool:
         """
@@ -660,24 +856,15 @@ class BlackjackGame:
         Returns:
             True if split successful, False otherwise.
         """
-        current_player = self.get_current_player()
-
-        if not current_player or current_player.user_id != user_id:
-            return False
-
-        if current_player.is_dealer:
-            logger.warning("Dealer cannot split")
+        validated = self._validate_player_action(user_id, "split")
+        if validated is None:
             return False
-
-        current_hand = current_player.get_current_hand()
+        current_player, current_hand = validated
 
         if not can_split(current_hand.cards):
             logger.warning("Cannot split - not a pair")
             return False
 
-        if current_hand.status != HandStatus.ACTIVE:
-            return False
-
         # Split the pair
         card1 = current_hand.cards[0]
         card2 = current_hand.cards[1]
@@ -691,24 +878,27 @@ class BlackjackGame:
         # SEQUENTIAL DEALING:
         # Deal second card to Hand 1 immediately
         new_card1 = self.deck.draw()
-        hand1.cards.append(new_card1)
+        hand1.add_card(new_card1)
         # Hand 2 gets its second card ONLY when we start playing it (in _advance_turn)
 
         logger.info(
-            f"{current_player.username} split {card1.rank}s - "
-            f"Hand 1: {card1} {new_card1}, Hand 2: {card2} (Waiting)"
+            "%s split %ss - Hand 1: %s %s, Hand 2: %s (Waiting)",
+            current_player.username,
+            card1.rank,
+            card1,
+            new_card1,
+            card2,
         )
 
         # Replace current hand with split hands
-        current_player.hands[current_player.current_hand_index] = hand1
-        current_player.hands.insert(current_player.current_hand_index + 1, hand2)
+        current_player.split_current_hand(hand1, hand2)
 
         # Split Aces rule: auto-stand both hands
         if is_aces:
-            hand1.status = HandStatus.SPLIT_ACES
+            current_player.set_hand_status(hand1, HandStatus.SPLIT_ACES)
             # Must deal Hand 2 its card now since we won't "play" it
-            hand2.cards.append(self.deck.draw())
-            hand2.status = HandStatus.SPLIT_ACES
+            hand2.add_card(self.deck.draw())
+            current_player.set_hand_status(hand2, HandStatus.SPLIT_ACES)
             logger.info("Split Aces - both hands auto-stand")
             self._advance_turn()
 
@@ -726,24 +916,17 @@ class BlackjackGame:
         Returns:
             True if successful, False if invalid.
         """
-        current_player = self.get_current_player()
-        if not current_player or current_player.user_id != user_id:
+        validated = self._validate_player_action(user_id, "surrender")
+        if validated is None:
             return False
-
-        if current_player.is_dealer:
-            return False
-
-        current_hand = current_player.get_current_hand()
+        current_player, current_hand = validated
 
         # Surrender only allowed on initial two cards and no split
         if len(current_hand.cards) != 2 or current_hand.is_split:
             logger.warning("Surrender only allowed on initial 2 cards")
             return False
 
-        if current_hand.status != HandStatus.ACTIVE:
-            return False
-
-        current_hand.status = HandStatus.SURRENDER
+        current_player.set_hand_status(current_hand, HandStatus.SURRENDER)
         logger.info(f"{current_player.username} surrendered")
         self._advance_turn()
         return True
@@ -761,7 +944,7 @@ class BlackjackGame:
         Returns:
             List of visible cards.
         """
-        if reveal_hole_card or self.phase in [GamePhase.DEALER_TURN, GamePhase.RESULTS]:
+        if reveal_hole_card or self._reveal_hole_card:
             return self.dealer.hands[0].cards
 
         # Hide hole card during player turns
@@ -769,11 +952,11 @@ class BlackjackGame:
 
     def should_reveal_hole_card(self) -> bool:
         """Check if hole card should be revealed based on current game phase."""
-        return self.phase in [GamePhase.DEALER_TURN, GamePhase.RESULTS]
+        return self._reveal_hole_card
 
     def is_game_over(self) -> bool:
         """Check if game has reached a terminal state."""
-        return self.phase in [GamePhase.RESULTS, GamePhase.ENDED]
+        return self._game_over
 
     def can_dealer_hit(self) -> bool:
         """
@@ -784,26 +967,40 @@ class BlackjackGame:
         Returns:
             True if dealer should hit.
         """
-        if not self.dealer.hands[0].cards:
+        hand = self.dealer.hands[0]
+        if not hand.cards:
             return False
 
-        hand = self.dealer.hands[0].cards
-        val = calculate_hand_value(hand)
-        is_soft = is_soft_hand(hand)
-
-        # Hit if < 17
-        if val < 17:
-            return True
-        # Hit if 17 and Soft (H17)
-        if val == 17 and is_soft:
-            return True
-
-        return False
+        # Hit if < 17, or 17 and Soft (H17)
+        return hand.total < 17 or (hand.total == 17 and hand.aces_high > 0)
 
     def can_dealer_stand(self) -> bool:
         """Check if dealer should stand (Hard 17+ or Soft 18+)."""
         return not self.can_dealer_hit()
 
+    def get_hand_line(
+        self, hand: PlayerHand, render: Callable[[PlayerHand, bool], str]
+    ) -> str:
+        """
+        Get a hand's rendered display line, rendering it only when it changed.
+
+        Lines are memoized on the hand's cards, status and the display style,
+        so a style toggle simply misses the cache rather than clearing it.
+
+        Args:
+            hand: Hand to render.
+            render: Called as `render(hand, use_emojis)` on a cache miss.
+
+        Returns:
+            The rendered line.
+        """
+        key = (tuple(hand.cards), hand.status, self.use_emojis)
+        line = self._hand_line_cache.get(key)
+        if line is None:
+            line = render(hand, self.use_emojis)
+            self._hand_line_cache[key] = line
+        return line
+
     def get_game_summary(self) -> Dict:
         """
         Get a dictionary summary of the game state for logging.
@@ -6,18 +6,65 @@ win conditions, formatting output strings, and handling specific rule checks
 like Soft 17 detection.
 """
 
-from typing import List
+from types import MappingProxyType
+from typing import List, Tuple
 
 from config.settings import (
     BLACKJACK_ACE_HIGH_VALUE,
     BLACKJACK_ACE_LOW_VALUE,
-    BLACKJACK_FACE_CARD_VALUE,
     BLACKJACK_INITIAL_CARDS_COUNT,
     BLACKJACK_VALUE,
 )
 from utils.assets import CARD_BACK_EMOJI
 from utils.blackjack_deck import Card
 
+_ACE_DEMOTION = BLACKJACK_ACE_HIGH_VALUE - BLACKJACK_ACE_LOW_VALUE  # Ace 11 -> 1
+
+# Display lookups, built once at import
+_STATUS_EMOJIS = MappingProxyType(
+    {
+        "active": "🎯",
+        "stand": "✋",
+        "bust": "💥",
+        "blackjack": "🎉",
+        "win": "🏆",
+        "lose": "💔",
+        "push": "🤝",
+    }
+)
+_RESULT_MESSAGES = MappingProxyType(
+    {"win": "WIN! 🏆", "lose": "LOSE 💔", "push": "PUSH 🤝"}
+)
+
+
+def _hand_sum_and_soft(cards: List[Card]) -> Tuple[int, bool]:
+    """
+    Compute a hand's best value and whether it is soft in a single pass.
+
+    Args:
+        cards: List of Card objects.
+
+    Returns:
+        Tuple of (best hand value, whether an Ace is still counted as 11).
+    """
+    total = 0
+    aces = 0
+
+    # Count value and number of Aces (bj_value counts an Ace as 11 initially)
+    for card in cards:
+        total += card.bj_value
+        if card.is_ace:
+            aces += 1
+
+    # Adjust for Aces if bust: demote just enough Aces from 11 to 1 at once
+    over = total - BLACKJACK_VALUE
+    if over > 0 and aces:
+        demoted = min(aces, -(-over // _ACE_DEMOTION))  # ceil(over / 10)
+        total -= demoted * _ACE_DEMOTION
+        aces -= demoted
+
+    return total, aces > 0
+
 
 def calculate_hand_value(cards: List[Card]) -> int:
     """
@@ -34,30 +81,7 @@ def calculate_hand_value(cards: List[Card]) -> int:
     Returns:
         The highest valid integer value of the hand.
     """
-    if not cards:
-        return 0
-
-    total = 0
-    aces = 0
-
-    # Count value and number of Aces
-    for card in cards:
-        if card.rank == "A":
-            aces += 1
-            total += BLACKJACK_ACE_HIGH_VALUE  # Count Ace as 11 initially
-        elif card.rank in ["J", "Q", "K"]:
-            total += BLACKJACK_FACE_CARD_VALUE
-        else:
-            total += int(card.rank)
-
-    # Adjust for Aces if bust
-    while total > BLACKJACK_VALUE and aces > 0:
-        total -= (
-            BLACKJACK_ACE_HIGH_VALUE - BLACKJACK_ACE_LOW_VALUE
-        )  # Convert an Ace from 11 to 1
-        aces -= 1
-
-    return total
+    return _hand_sum_and_soft(cards)[0]
 
 
 def is_blackjack(cards: List[Card]) -> bool:
@@ -76,7 +100,8 @@ def is_blackjack(cards: List[Card]) -> bool:
     if len(cards) != BLACKJACK_INITIAL_CARDS_COUNT:
         return False
 
-    return calculate_hand_value(cards) == BLACKJACK_VALUE
+    # Two cards can only reach 21 as Ace (11) + a ten-value card; no Ace demotion
+    return cards[0].bj_value + cards[1].bj_value == BLACKJACK_VALUE
 
 
 def is_bust(cards: List[Card]) -> bool:
@@ -106,26 +131,18 @@ def is_soft_hand(cards: List[Card]) -> bool:
     Returns:
         True if the hand is soft, False otherwise.
     """
-    has_ace = any(card.rank == "A" for card in cards)
-
-    if not has_ace:
-        return False
-
-    # Calculate without Ace bonus
-    total_without_ace = sum(
-        BLACKJACK_FACE_CARD_VALUE
-        if card.rank in ["J", "Q", "K"]
-        else BLACKJACK_ACE_LOW_VALUE
-        if card.rank == "A"
-        else int(card.rank)
-        for card in cards
-    )
+    # Total with every Ace counted as 1
+    total = 0
+    has_ace = False
+    for card in cards:
+        if card.is_ace:
+            has_ace = True
+            total += BLACKJACK_ACE_LOW_VALUE
+        else:
+            total += card.bj_value
 
-    # If using Ace as 11 doesn't bust, it's soft
-    return (
-        total_without_ace + (BLACKJACK_ACE_HIGH_VALUE - BLACKJACK_ACE_LOW_VALUE)
-        <= BLACKJACK_VALUE
-    )
+    # If using one Ace as 11 doesn't bust, it's soft
+    return has_ace and total + _ACE_DEMOTION <= BLACKJACK_VALUE
 
 
 def can_split(cards: List[Card]) -> bool:
@@ -144,7 +161,7 @@ def can_split(cards: List[Card]) -> bool:
     if len(cards) != BLACKJACK_INITIAL_CARDS_COUNT:
         return False
 
-    return cards[0].rank == cards[1].rank
+    return cards[0].rank_id == cards[1].rank_id
 
 
 def format_hand(
@@ -165,25 +182,15 @@ def format_hand(
     if not cards:
         return "—"
 
-    display_cards = []
+    render = Card.get_emoji if use_emojis else Card.__str__
 
-    # Process visible cards
-    for i, card in enumerate(cards):
-        if hide_second and i == 1:
-            # Hidden card
-            if use_emojis:
-                display_cards.append(CARD_BACK_EMOJI)
-            else:
-                display_cards.append("??")
-        else:
-            # Visible card
-            if use_emojis:
-                display_cards.append(card.get_emoji())
-            else:
-                display_cards.append(str(card))
+    if hide_second and len(cards) > 1:
+        # Hidden card (dealer's hole card) in second position
+        hidden = CARD_BACK_EMOJI if use_emojis else "??"
+        return " ".join([render(cards[0]), hidden, *map(render, cards[2:])])
 
     # Join with space
-    return " ".join(display_cards)
+    return " ".join(map(render, cards))
 
 
 def format_hand_with_value(
@@ -205,10 +212,10 @@ def format_hand_with_value(
     if hide_second:
         return f"{hand_str} = ?"
 
-    value = calculate_hand_value(cards)
+    value, soft = _hand_sum_and_soft(cards)
 
     # Add soft indicator if applicable
-    if is_soft_hand(cards):
+    if soft:
         return f"{hand_str} = {value} (soft)"
 
     return f"{hand_str} = {value}"
@@ -277,17 +284,7 @@ def get_hand_status_emoji(status: str) -> str:
     Returns:
         Emoji character string.
     """
-    status_emojis = {
-        "active": "🎯",
-        "stand": "✋",
-        "bust": "💥",
-        "blackjack": "🎉",
-        "win": "🏆",
-        "lose": "💔",
-        "push": "🤝",
-    }
-
-    return status_emojis.get(status, "❓")
+    return _STATUS_EMOJIS.get(status, "❓")
 
 
 def get_result_message(result: str) -> str:
@@ -300,6 +297,4 @@ def get_result_message(result: str) -> str:
     Returns:
         Formatted string description.
     """
-    messages = {"win": "WIN! 🏆", "lose": "LOSE 💔", "push": "PUSH 🤝"}
-
-    return messages.get(result, "???")
+    return _RESULT_MESSAGES.get(result, "???")
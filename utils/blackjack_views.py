@@ -4,7 +4,7 @@ Discord UI views for the Blackjack game.
 This module implements the interactive components (Buttons, Views) for:
 - Game Lobby: Joining, setting options, starting the game.
 - Active Game: Hit, Stand, Double, Split, Surrender actions.
-- Real-time updates: Turn timers and visual countdowns.
+- Real-time updates: Turn timers and live turn deadlines.
 
 It handles the presentation layer, forwarding user actions to the
 BlackjackGame model logic (MVC pattern).
@@ -17,25 +17,26 @@ from typing import Callable, Optional
 
 import discord
 
-from config.settings import (
-    BLACKJACK_TURN_TIMER_UPDATE_INTERVAL,
-    BLACKJACK_TURN_TIMER_WARNING_THRESHOLD,
-    BLACKJACK_VALUE,
-)
-from utils.blackjack_game import BlackjackGame, GamePhase, HandStatus
+from utils.blackjack_game import BlackjackGame, GamePhase, HandStatus, PlayerHand
 from utils.blackjack_helpers import (
-    calculate_hand_value,
     can_split,
     determine_winner,
     format_hand,
     format_hand_with_value,
     get_result_message,
-    is_blackjack,
 )
 from utils.helpers import create_error_embed, create_success_embed
 
 logger = logging.getLogger("smogon_bot.blackjack")
 
+_HAND_STATUS_SUFFIXES = {
+    HandStatus.BLACKJACK: " (BLACKJACK! 🎉)",
+    HandStatus.BUST: " (BUST 💥)",
+    HandStatus.STAND: " (STAND ✋)",
+    HandStatus.SPLIT_ACES: " (SPLIT ACES - STAND ✋)",
+    HandStatus.SURRENDER: " (SURRENDER 🏳️)",
+}
+
 
 class BlackjackLobbyView(discord.ui.View):
     """
@@ -64,20 +65,17 @@ class BlackjackLobbyView(discord.ui.View):
         self.game = game
         self.cleanup_callback = cleanup_callback
         self.message: Optional[discord.Message] = None
+        # Last lobby embed and the roster/style it was built for
+        self._lobby_embed: Optional[discord.Embed] = None
+        self._lobby_embed_key: Optional[tuple] = None
         self._update_style_button_label()
 
     def _update_style_button_label(self):
         """Update the style toggle button label based on current game state."""
-        # Find the style button (custom_id="style_toggle")
-        for child in self.children:
-            if (
-                isinstance(child, discord.ui.Button)
-                and child.custom_id == "style_toggle"
-            ):
-                mode_text = "Emojis" if self.game.use_emojis else "Text"
-                child.label = f"Style: {mode_text}"
-                child.emoji = "🎨" if self.game.use_emojis else "📝"
-                break
+        # The decorated callback is bound to its Button item on the view
+        mode_text = "Emojis" if self.game.use_emojis else "Text"
+        self.style_button.label = f"Style: {mode_text}"
+        self.style_button.emoji = "🎨" if self.game.use_emojis else "📝"
 
     @discord.ui.button(
         label="Join as Player", style=discord.ButtonStyle.green, emoji="👥"
@@ -212,8 +210,8 @@ class BlackjackLobbyView(discord.ui.View):
             game_view.stop()
             return
 
-        # Start turn timer background task
-        asyncio.create_task(game_view.start_turn_timer())
+        # Start turn timer
+        await game_view.start_turn_timer()
 
     @discord.ui.button(label="Cancel", style=discord.ButtonStyle.red, emoji="❌")
     async def cancel_button(
@@ -267,7 +265,18 @@ class BlackjackLobbyView(discord.ui.View):
         self.stop()
 
     def create_lobby_embed(self) -> discord.Embed:
-        """Generate the lobby status embed."""
+        """
+        Generate the lobby status embed.
+
+        The embed is rebuilt only when the roster or display style changed
+        since the last call. Players can also leave through a slash command
+        that bypasses this view, so the roster is compared directly rather
+        than tracked with a dirty flag.
+        """
+        key = (tuple(p.user_id for p in self.game.players), self.game.use_emojis)
+        if key == self._lobby_embed_key:
+            return self._lobby_embed
+
         embed = discord.Embed(
             title="🃏 Blackjack Game Lobby", color=discord.Color.blue()
         )
@@ -299,6 +308,7 @@ class BlackjackLobbyView(discord.ui.View):
             text="Click 'Join as Player' to join • Dealer clicks 'Start Game' when ready"
         )
 
+        self._lobby_embed, self._lobby_embed_key = embed, key
         return embed
 
     def create_dealer_private_embed(self) -> discord.Embed:
@@ -352,90 +362,104 @@ class BlackjackGameView(discord.ui.View):
         self.cleanup_callback = cleanup_callback
         self.message: Optional[discord.Message] = None
         self.turn_timeout = timeout
-        self.turn_task: Optional[asyncio.Task] = None
-        self._timer_lock = asyncio.Lock()
-        # Track turn start time for countdown calculations
+        self._timer_task: Optional[asyncio.Task] = None  # See start_turn_timer
+        self._turn_reset = asyncio.Event()  # Set to restart the turn clock
+        # Track turn start time for the turn deadline
         self.turn_start_time: Optional[float] = None
+
+        # Action buttons, built once and re-attached by update_buttons
+        self._hit_button = self._make_button(
+            "Hit", discord.ButtonStyle.primary, "🎯", "hit", self.hit_callback
+        )
+        self._stand_button = self._make_button(
+            "Stand", discord.ButtonStyle.secondary, "✋", "stand", self.stand_callback
+        )
+        self._double_button = self._make_button(
+            "Double Down",
+            discord.ButtonStyle.success,
+            "2️⃣",
+            "double",
+            self.double_callback,
+        )
+        self._split_button = self._make_button(
+            "Split", discord.ButtonStyle.success, "✂️", "split", self.split_callback
+        )
+        self._surrender_button = self._make_button(
+            "Surrender",
+            discord.ButtonStyle.danger,
+            "🏳️",
+            "surrender",
+            self.surrender_callback,
+        )
+        self._button_layout: Optional[tuple] = None  # Last layout shown
         self.update_buttons()
 
+    def _make_button(
+        self,
+        label: str,
+        style: discord.ButtonStyle,
+        emoji: str,
+        custom_id: str,
+        callback: Callable,
+    ) -> discord.ui.Button:
+        """Create an action button wired to one of this view's callbacks."""
+        button = discord.ui.Button(
+            label=label, style=style, emoji=emoji, custom_id=custom_id
+        )
+        button.callback = callback
+        return button
+
     def update_buttons(self) -> None:
         """
         Refresh button states based on the current turn.
 
         Enables/Disables Split, Double Down, and Surrender based on rules.
+        The buttons are created once and re-attached; if the layout matches
+        the one already shown, the view is left untouched.
         """
-        self.clear_items()
-
         current_player = self.game.get_current_player()
 
         if not current_player or self.game.is_game_over():
+            self.clear_items()
+            self._button_layout = None
             return
 
         current_hand = current_player.get_current_hand()
-
-        # Hit button
-        hit_button = discord.ui.Button(
-            label="Hit", style=discord.ButtonStyle.primary, emoji="🎯", custom_id="hit"
+        is_dealer = current_player.is_dealer
+        two_cards = len(current_hand.cards) == 2
+
+        layout = (
+            # Disable hit for dealer if ≥17 (Hard) or Hitting Soft 17 Allowed logic
+            is_dealer and not self.game.can_dealer_hit(),
+            # Disable stand for dealer if <17
+            is_dealer and not self.game.can_dealer_stand(),
+            # Double Down (players only, 2 cards)
+            not is_dealer and two_cards,
+            # Split (players only, pairs)
+            not is_dealer and can_split(current_hand.cards),
+            # Surrender (players only, 2 cards, no split)
+            not is_dealer and two_cards and not current_hand.is_split,
         )
+        if layout == self._button_layout:
+            return
+        self._button_layout = layout
 
-        # Disable hit for dealer if ≥17 (Hard) or Hitting Soft 17 Allowed logic
-        if current_player.is_dealer and not self.game.can_dealer_hit():
-            hit_button.disabled = True
-
-        hit_button.callback = self.hit_callback
-        self.add_item(hit_button)
+        hit_disabled, stand_disabled, show_double, show_split, show_surrender = layout
 
-        # Stand button
-        stand_button = discord.ui.Button(
-            label="Stand",
-            style=discord.ButtonStyle.secondary,
-            emoji="✋",
-            custom_id="stand",
-        )
+        self.clear_items()
 
-        # Disable stand for dealer if <17
-        if current_player.is_dealer and not self.game.can_dealer_stand():
-            stand_button.disabled = True
+        self._hit_button.disabled = hit_disabled
+        self.add_item(self._hit_button)
 
-        stand_button.callback = self.stand_callback
-        self.add_item(stand_button)
+        self._stand_button.disabled = stand_disabled
+        self.add_item(self._stand_button)
 
-        # Double Down (players only, 2 cards)
-        if not current_player.is_dealer and len(current_hand.cards) == 2:
-            double_button = discord.ui.Button(
-                label="Double Down",
-                style=discord.ButtonStyle.success,
-                emoji="2️⃣",
-                custom_id="double",
-            )
-            double_button.callback = self.double_callback
-            self.add_item(double_button)
-
-        # Split (players only, pairs)
-        if not current_player.is_dealer and can_split(current_hand.cards):
-            split_button = discord.ui.Button(
-                label="Split",
-                style=discord.ButtonStyle.success,
-                emoji="✂️",
-                custom_id="split",
-            )
-            split_button.callback = self.split_callback
-            self.add_item(split_button)
-
-        # Surrender (players only, 2 cards, no split)
-        if (
-            not current_player.is_dealer
-            and len(current_hand.cards) == 2
-            and not current_hand.is_split
-        ):
-            surrender_button = discord.ui.Button(
-                label="Surrender",
-                style=discord.ButtonStyle.danger,
-                emoji="🏳️",
-                custom_id="surrender",
-            )
-            surrender_button.callback = self.surrender_callback
-            self.add_item(surrender_button)
+        if show_double:
+            self.add_item(self._double_button)
+        if show_split:
+            self.add_item(self._split_button)
+        if show_surrender:
+            self.add_item(self._surrender_button)
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """
@@ -459,9 +483,9 @@ class BlackjackGameView(discord.ui.View):
 
     async def hit_callback(self, interaction: discord.Interaction) -> None:
         """Handle 'Hit' action."""
-        card = self.game.hit(interaction.user.id)
+        result = self.game.hit(interaction.user.id)
 
-        if card:
+        if result.success:
             await self.update_game_state(interaction)
         else:
             embed = create_error_embed("Invalid Move", "Cannot hit at this time!")
@@ -477,9 +501,9 @@ class BlackjackGameView(discord.ui.View):
 
     async def double_callback(self, interaction: discord.Interaction) -> None:
         """Handle 'Double Down' action."""
-        card = self.game.double_down(interaction.user.id)
+        result = self.game.double_down(interaction.user.id)
 
-        if card:
+        if result.success:
             await self.update_game_state(interaction)
         else:
             embed = create_error_embed("Invalid Move", "Cannot double down!")
@@ -505,170 +529,128 @@ class BlackjackGameView(discord.ui.View):
         """
         Refreshes the game UI after an action.
 
-        1. Cancels the current turn timer.
-        2. Checks if game ended.
-        3. Updates buttons for the next state.
-        4. Edits the message embed.
-        5. Starts a new turn timer.
+        1. Restarts the turn clock.
+        2. Shows the results if the game ended, otherwise updates the
+           buttons and embed for the next state (one message edit).
         """
         await interaction.response.defer()
 
-        # Cancel turn timer with lock to prevent race condition
-        async with self._timer_lock:
-            if self.turn_task and not self.turn_task.done():
-                self.turn_task.cancel()
-                try:
-                    await self.turn_task
-                except asyncio.CancelledError:
-                    pass
-                self.turn_task = None
-
-        # Check if game over (could happen from auto-stand)
-        if self.game.phase == GamePhase.RESULTS:
-            results_embed = create_results_embed(self.game)
-            await self.message.edit(embed=results_embed, view=None, attachments=[])
-            if self.cleanup_callback:
-                self.cleanup_callback()
-            self.stop()
-            return
+        # Reset the turn clock; the timer loop picks up the new deadline
+        await self.start_turn_timer()
 
-        # Update buttons for next turn
-        self.update_buttons()
+        await self._render_and_edit()
 
-        # Check if game moved to results after updating (dealer auto-stand case)
+    async def _render_and_edit(self) -> bool:
+        """
+        Push the current game state to the message in a single edit.
+
+        Shows the results (and tears the view down) if the game has ended,
+        otherwise refreshes the buttons and the table embed.
+
+        Returns:
+            True if the game has ended.
+        """
         if self.game.phase == GamePhase.RESULTS:
             results_embed = create_results_embed(self.game)
             await self.message.edit(embed=results_embed, view=None, attachments=[])
             if self.cleanup_callback:
                 self.cleanup_callback()
             self.stop()
-            return
+            return True
 
-        # Update game display
-        game_embed = create_game_embed(self.game)
+        self.update_buttons()
+        game_embed = create_game_embed(self.game, turn_deadline=self.turn_deadline)
         await self.message.edit(embed=game_embed, view=self)
-
-        # Start new turn timer
-        asyncio.create_task(self.start_turn_timer())
+        return False
 
     async def start_turn_timer(self) -> None:
         """
-        Start the turn timeout background task.
+        Start or restart the turn clock.
 
-        Uses a lock (`_timer_lock`) to ensure only one timer is running at a time,
-        preventing race conditions when users spam buttons.
+        A single `_timer_loop` task serves the whole game. The first call
+        launches it; later calls only signal `_turn_reset`, so button presses
+        never cancel and respawn timer tasks.
         """
-        async with self._timer_lock:
-            # Cancel existing timer if running
-            if self.turn_task and not self.turn_task.done():
-                self.turn_task.cancel()
-                try:
-                    await self.turn_task
-                except asyncio.CancelledError:
-                    pass
-
-            # Record turn start time for countdown
-            self.turn_start_time = time.time()
-
-            # Create new timer task
-            self.turn_task = asyncio.create_task(self._turn_timeout())
-
-    async def _turn_timeout(self) -> None:
+        self.turn_start_time = time.time()
+
+        if self._timer_task is None or self._timer_task.done():
+            self._timer_task = asyncio.create_task(self._timer_loop())
+        else:
+            self._turn_reset.set()
+
+    @property
+    def turn_deadline(self) -> Optional[float]:
+        """Unix time at which the current turn times out, if the clock runs."""
+        if self.turn_start_time is None:
+            return None
+        return self.turn_start_time + self.turn_timeout
+
+    def stop(self) -> None:
+        """Stop the view and wake the timer loop so it can exit."""
+        super().stop()
+        self._turn_reset.set()
+
+    async def _wait_for_turn_reset(self, timeout: float) -> bool:
         """
-        Handle turn timeout logic.
+        Wait for the turn clock to be reset (or the view stopped).
 
-        Checks elapsed time and updates the embed footer with a countdown
-        when the timer is close to expiring (warning threshold).
-        Forces an 'Auto-Stand' if the time runs out.
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if woken by a reset, False if the timeout elapsed.
         """
         try:
-            elapsed = 0
-            last_update = 0
-
-            while elapsed < self.turn_timeout:
-                await asyncio.sleep(1)
-                elapsed += 1
-                remaining = self.turn_timeout - elapsed
-
-                # Update embed footer with countdown when ≤ warning threshold
-                if remaining <= BLACKJACK_TURN_TIMER_WARNING_THRESHOLD:
-                    # Only update every N seconds to avoid rate limits
-                    if (
-                        elapsed - last_update >= BLACKJACK_TURN_TIMER_UPDATE_INTERVAL
-                        or remaining <= 5
-                    ):
-                        try:
-                            await self._update_turn_countdown(remaining)
-                            last_update = elapsed
-                        except discord.HTTPException as e:
-                            logger.warning(f"Failed to update countdown: {e}")
-
-            # Timeout reached - auto-stand
-            current_player = self.game.get_current_player()
-            if current_player:
-                logger.info(
-                    "Player turn timed out",
-                    extra={
-                        "user_id": current_player.user_id,
-                        "username": current_player.username,
-                        "timeout_seconds": self.turn_timeout,
-                        "action": "auto_stand",
-                    },
-                )
-                self.game.stand(current_player.user_id)
-
-                # Update game state
-                if self.game.phase == GamePhase.RESULTS:
-                    results_embed = create_results_embed(self.game)
-                    await self.message.edit(
-                        embed=results_embed, view=None, attachments=[]
-                    )
-                    if self.cleanup_callback:
-                        self.cleanup_callback()
-                    self.stop()
-                else:
-                    self.update_buttons()
-
-                    # Check again after updating buttons (dealer could have auto-stood)
-                    if self.game.phase == GamePhase.RESULTS:
-                        results_embed = create_results_embed(self.game)
-                        await self.message.edit(
-                            embed=results_embed, view=None, attachments=[]
-                        )
-                        if self.cleanup_callback:
-                            self.cleanup_callback()
-                        self.stop()
-                        return
-
-                    # Update embed
-                    game_embed = create_game_embed(self.game)
-                    await self.message.edit(embed=game_embed, view=self)
-
-                    asyncio.create_task(self.start_turn_timer())
+            await asyncio.wait_for(self._turn_reset.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
 
-        except asyncio.CancelledError:
-            # Timer was cancelled (normal operation)
-            pass
-        except Exception as e:
-            logger.error(f"Error in turn timeout: {e}", exc_info=True)
+        self._turn_reset.clear()
+        return True
 
-    async def _update_turn_countdown(self, remaining_seconds: int) -> None:
+    async def _timer_loop(self) -> None:
         """
-        Update the embed footer with the remaining seconds.
+        Run turn timeouts until the view stops.
 
-        Called periodically by `_turn_timeout` to provide visual urgency.
+        Each iteration sleeps until the current turn's deadline; a reset
+        restarts the wait, while running out of time forces an auto-stand.
+        The visible countdown is a Discord relative timestamp in the embed,
+        so no edits are needed while waiting.
+
+        Waits are measured against the absolute `turn_deadline` rather than
+        a fresh `turn_timeout`, so time spent editing the message counts
+        towards the turn and the auto-stand lands on the displayed deadline.
         """
         try:
-            current_player = self.game.get_current_player()
-            if not current_player:
-                return
+            while not self.is_finished():
+                remaining = max(0.0, self.turn_deadline - time.time())
+                if not await self._wait_for_turn_reset(remaining):
+                    await self._auto_stand()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Error in turn timer: {e}", exc_info=True)
 
-            # Get current embed with updated countdown
-            game_embed = create_game_embed(self.game, countdown=remaining_seconds)
-            await self.message.edit(embed=game_embed)
+    async def _auto_stand(self) -> None:
+        """Force the current player to stand after their turn timed out."""
+        # Next turn starts now (also keeps the loop from spinning on a no-op)
+        self.turn_start_time = time.time()
 
-        except Exception as e:
-            logger.debug(f"Error updating countdown: {e}")
+        current_player = self.game.get_current_player()
+        if not current_player:
+            return
+
+        logger.info(
+            "Player turn timed out",
+            extra={
+                "user_id": current_player.user_id,
+                "username": current_player.username,
+                "timeout_seconds": self.turn_timeout,
+                "action": "auto_stand",
+            },
+        )
+        self.game.stand(current_player.user_id)
+        await self._render_and_edit()
 
     async def on_timeout(self) -> None:
         """
@@ -692,15 +674,56 @@ class BlackjackGameView(discord.ui.View):
         self.stop()
 
 
+def _format_hand_with_total(hand: PlayerHand, use_emojis: bool) -> str:
+    """
+    Format a hand like `format_hand_with_value`, reusing its running total.
+
+    Args:
+        hand: Hand to format.
+        use_emojis: Whether to render cards as custom emojis.
+
+    Returns:
+        String in format "Card1 Card2 = Value", with a soft marker if needed.
+    """
+    hand_str = format_hand(hand.cards, use_emojis=use_emojis)
+    if hand.is_soft:
+        return f"{hand_str} = {hand.total} (soft)"
+    return f"{hand_str} = {hand.total}"
+
+
+def _render_hand_line(hand: PlayerHand, use_emojis: bool) -> str:
+    """
+    Render a hand with its value and status indicator.
+
+    The game embed is rebuilt on every action and auto-stand, but usually
+    only one hand has changed since the last frame, so callers go through
+    `BlackjackGame.get_hand_line` to reuse unchanged lines.
+
+    Args:
+        hand: Hand to render.
+        use_emojis: Whether to render cards as custom emojis.
+
+    Returns:
+        The formatted hand line (without any "Hand N:" prefix).
+    """
+    line = _format_hand_with_total(hand, use_emojis)
+    return line + _HAND_STATUS_SUFFIXES.get(hand.status, "")
+
+
 def create_game_embed(
-    game: BlackjackGame, countdown: Optional[int] = None
+    game: BlackjackGame, turn_deadline: Optional[float] = None
 ) -> discord.Embed:
     """
     Create the main gameplay embed showing the table state.
 
+    The current turn's deadline is shown as a Discord relative timestamp,
+    which clients count down on their own without further message edits.
+
     Args:
         game: The BlackjackGame instance.
-        countdown: Optional remaining seconds to display in the footer.
+        turn_deadline: Unix time the current turn times out. Defaults to
+            the game's turn timeout from now, since embeds are rendered as
+            a turn starts.
 
     Returns:
         Discord Embed object.
@@ -711,12 +734,14 @@ def create_game_embed(
     use_emojis = game.use_emojis
 
     # Dealer's hand
-    dealer_hand = game.dealer.hands[0].cards
-    reveal_hole = game.should_reveal_hole_card()
+    dealer_hand = game.dealer.hands[0]
 
-    dealer_text = format_hand_with_value(
-        dealer_hand, hide_second=not reveal_hole, use_emojis=use_emojis
-    )
+    if game.should_reveal_hole_card():
+        dealer_text = _format_hand_with_total(dealer_hand, use_emojis)
+    else:
+        dealer_text = format_hand_with_value(
+            dealer_hand.cards, hide_second=True, use_emojis=use_emojis
+        )
 
     embed.add_field(
         name=f"🎲 Dealer ({game.dealer.username})", value=dealer_text, inline=False
@@ -725,59 +750,46 @@ def create_game_embed(
     embed.add_field(name="", value="", inline=False)  # Separator
 
     # Players' hands
+    current_player = game.get_current_player()
+    current_id = current_player.user_id if current_player else None
+
     for player in game.players:
+        multiple_hands = player.has_multiple_hands()
         player_text_lines = []
 
-        for hand_idx, hand in enumerate(player.hands):
-            hand_prefix = f"Hand {hand_idx + 1}: " if len(player.hands) > 1 else ""
-            hand_text = format_hand_with_value(hand.cards, use_emojis=use_emojis)
-
-            # Add status indicators
-            if hand.status == HandStatus.BLACKJACK:
-                hand_text += " (BLACKJACK! 🎉)"
-            elif hand.status == HandStatus.BUST:
-                hand_text += " (BUST 💥)"
-            elif hand.status == HandStatus.STAND:
-                hand_text += " (STAND ✋)"
-            elif hand.status == HandStatus.SPLIT_ACES:
-                hand_text += " (SPLIT ACES - STAND ✋)"
-            elif hand.status == HandStatus.SURRENDER:
-                hand_text += " (SURRENDER 🏳️)"
-
-            player_text_lines.append(f"{hand_prefix}{hand_text}")
-
-        player_full_text = "\n".join(player_text_lines)
-
         # Indicate current turn
-        current_player = game.get_current_player()
-        if (
-            current_player
-            and current_player.user_id == player.user_id
-            and not player.is_dealer
-        ):
-            if player.has_multiple_hands():
-                player_full_text = f"**YOUR TURN** (Playing Hand {player.current_hand_index + 1})\n{player_full_text}"
+        is_turn = player.user_id == current_id and not player.is_dealer
+        if is_turn:
+            if multiple_hands:
+                player_text_lines.append(
+                    f"**YOUR TURN** (Playing Hand {player.current_hand_index + 1})"
+                )
             else:
-                player_full_text = f"**YOUR TURN**\n{player_full_text}"
-        elif player.all_hands_finished():
-            player_full_text += "\n*[Waiting...]*"
+                player_text_lines.append("**YOUR TURN**")
+
+        for hand_idx, hand in enumerate(player.hands):
+            hand_text = game.get_hand_line(hand, _render_hand_line)
+            if multiple_hands:
+                hand_text = f"Hand {hand_idx + 1}: {hand_text}"
+            player_text_lines.append(hand_text)
+
+        if not is_turn and player.all_hands_finished():
+            player_text_lines.append("*[Waiting...]*")
 
         embed.add_field(
-            name=f"👤 {player.username}", value=player_full_text, inline=False
+            name=f"👤 {player.username}",
+            value="\n".join(player_text_lines),
+            inline=False,
         )
 
     # Footer logic
     style_name = "Emojis" if use_emojis else "Text"
-    current_player = game.get_current_player()
 
     if current_player:
-        if (
-            countdown is not None
-            and countdown <= BLACKJACK_TURN_TIMER_WARNING_THRESHOLD
-        ):
-            footer_text = f"⏰ {countdown}s remaining • Current turn: {current_player.username} • Style: {style_name}"
-        else:
-            footer_text = f"Current turn: {current_player.username} • {game.timeout}s timeout • Style: {style_name}"
+        if turn_deadline is None:
+            turn_deadline = time.time() + game.timeout
+        embed.description = f"⏰ {current_player.username}'s turn ends <t:{int(turn_deadline)}:R>"
+        footer_text = f"Current turn: {current_player.username} • {game.timeout}s timeout • Style: {style_name}"
     else:
         footer_text = f"Game in progress... • Style: {style_name}"
 
@@ -804,20 +816,14 @@ def create_results_embed(game: BlackjackGame) -> discord.Embed:
     use_emojis = game.use_emojis
 
     # Check if all players busted (dealer didn't play)
-    all_players_busted_surrendered = all(
-        all(
-            hand.status in [HandStatus.BUST, HandStatus.SURRENDER]
-            for hand in player.hands
-        )
-        for player in game.players
-    )
+    all_players_busted_surrendered = game.all_players_busted_or_surrendered()
 
     # Dealer's final hand
-    dealer_hand = game.dealer.hands[0].cards
-    dealer_value = calculate_hand_value(dealer_hand)
-    dealer_bj = is_blackjack(dealer_hand)
+    dealer_hand = game.dealer.hands[0]
+    dealer_value = dealer_hand.total
+    dealer_bj = dealer_hand.is_blackjack
 
-    formatted_hand = format_hand_with_value(dealer_hand, use_emojis=use_emojis)
+    formatted_hand = _format_hand_with_total(dealer_hand, use_emojis)
 
     if all_players_busted_surrendered:
         # Dealer didn't play - show hole card but indicate auto-win
@@ -828,7 +834,7 @@ def create_results_embed(game: BlackjackGame) -> discord.Embed:
         dealer_status = ""
         if dealer_bj:
             dealer_status = " (BLACKJACK! 🎉)"
-        elif dealer_value > BLACKJACK_VALUE:
+        elif dealer_hand.is_bust:
             dealer_status = " (BUST 💥)"
 
         dealer_text = f"{formatted_hand}{dealer_status}"
@@ -845,10 +851,7 @@ def create_results_embed(game: BlackjackGame) -> discord.Embed:
 
         for hand_idx, hand in enumerate(player.hands):
             hand_prefix = f"Hand {hand_idx + 1}: " if len(player.hands) > 1 else ""
-            hand_text = format_hand_with_value(hand.cards, use_emojis=use_emojis)
-
-            player_value = calculate_hand_value(hand.cards)
-            player_bj = is_blackjack(hand.cards)
+            hand_text = _format_hand_with_total(hand, use_emojis)
 
             # Determine result
             if hand.status == HandStatus.BUST:
@@ -858,7 +861,7 @@ def create_results_embed(game: BlackjackGame) -> discord.Embed:
                 hand_text += " (Surrendered 🏳️)"
             else:
                 result = determine_winner(
-                    player_value, dealer_value, player_bj, dealer_bj
+                    hand.total, dealer_value, hand.is_blackjack, dealer_bj
                 )
 
             if result != "surrender":
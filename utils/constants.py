@@ -52,6 +52,46 @@ MAX_MESSAGE_HISTORY_FOR_LOGS = 100  # Messages to check for logging purposes
 CACHE_CLEANUP_INTERVAL = 300  # Seconds (5 minutes)
 CACHE_SAVE_DEBOUNCE_SECONDS = 5  # Debounce frequent saves
 CACHE_KEY_HASH_ALGORITHM = "md5"  # Algorithm for cache key hashing
+CACHE_COMPRESS_MIN_BYTES = 4096  # Compress cache payloads at least this large
+CACHE_COMPRESS_LEVEL = 3  # zlib level (favors speed over ratio)
+
+# Sprite Prewarming (most requested Pokemon, fetched on startup)
+SPRITE_PREWARM_CONCURRENCY = 8  # Concurrent PokeAPI requests while warming
+SPRITE_PREWARM_POKEMON = (
+    "pikachu",
+    "charizard",
+    "bulbasaur",
+    "charmander",
+    "squirtle",
+    "eevee",
+    "mewtwo",
+    "mew",
+    "gengar",
+    "snorlax",
+    "dragonite",
+    "gyarados",
+    "lucario",
+    "garchomp",
+    "greninja",
+    "rayquaza",
+    "umbreon",
+    "sylveon",
+    "tyranitar",
+    "metagross",
+    "blaziken",
+    "gardevoir",
+    "dragapult",
+    "kingambit",
+    "gholdengo",
+    "great-tusk",
+    "iron-valiant",
+    "toxapex",
+    "ferrothorn",
+    "corviknight",
+    "heatran",
+    "clefable",
+    "dondozo",
+)
 
 # Backup Configuration
 SHINY_CONFIG_BACKUP_KEEP = 3  # Number of backup files to keep
@@ -8,15 +8,55 @@ import asyncio
 import json
 import logging
 import time
-from typing import Any, Dict, Optional, Set, Tuple
+import zlib
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 import aiosqlite
+import orjson
 
 from config.settings import DB_CONNECTION_STRING
+from utils.constants import CACHE_COMPRESS_LEVEL, CACHE_COMPRESS_MIN_BYTES
 
 logger = logging.getLogger("smogon_bot.database")
 
+# First byte of a zlib stream; never the first byte of a JSON document
+_ZLIB_MAGIC = 0x78
+
+
+def _encode_cache_data(data: Any) -> bytes:
+    """
+    Serialize data for the cache table.
+
+    Large payloads (e.g., the full species list) are zlib-compressed; small
+    ones stay plain JSON.
+
+    Args:
+        data: JSON-serializable data.
+
+    Returns:
+        Encoded bytes.
+    """
+    payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    if len(payload) >= CACHE_COMPRESS_MIN_BYTES:
+        return zlib.compress(payload, CACHE_COMPRESS_LEVEL)
+    return payload
+
+
+def _decode_cache_data(raw: Any) -> Any:
+    """
+    Deserialize a cache table value written by `_encode_cache_data`.
+
+    Args:
+        raw: Stored value (bytes, or str for older rows).
+
+    Returns:
+        The deserialized data.
+    """
+    if isinstance(raw, bytes) and raw[:1] == bytes((_ZLIB_MAGIC,)):
+        raw = zlib.decompress(raw)
+    return orjson.loads(raw)
+
 
 class Database:
     """
@@ -27,7 +67,10 @@ class Database:
     - **guild_configs**: Stores shiny monitoring settings per guild.
       Columns: guild_id (PK), channels (JSON List), archive_channel_id, updated_at.
     - **api_cache**: Stores API responses with expiration and access tracking.
-      Columns: cache_key (PK), data (JSON), created_at, last_accessed, access_count.
+      Columns: cache_key (PK), data (JSON), created_at, last_accessed, access_count,
+      expires_at (when the row may be purged; set per entry by the writer).
+      Cache data is (de)serialized with orjson; rows may hold UTF-8 JSON as
+      either TEXT (older rows) or BLOB.
 
     WARNING:
         Automated use of the `VACUUM` command is strongly discouraged. It requires
@@ -91,6 +134,7 @@ class Database:
         """Internal method to establish connection to SQLite file."""
         self._conn = await aiosqlite.connect(self.db_path)
         self._conn.row_factory = aiosqlite.Row
+        await self._configure_sqlite()
         await self._create_tables()
         logger.info(f"Database connected ({self.db_type}): {self.db_path}")
 
@@ -100,6 +144,18 @@ class Database:
             await self._conn.close()
             logger.info("Database connection closed")
 
+    async def _configure_sqlite(self) -> None:
+        """
+        Apply connection-level pragmas for a read-heavy cache workload.
+
+        WAL lets readers proceed while a write is in progress, and
+        `synchronous=NORMAL` is durable under WAL while avoiding an fsync on
+        every commit.
+        """
+        await self._conn.execute("PRAGMA journal_mode=WAL")  # type: ignore
+        await self._conn.execute("PRAGMA synchronous=NORMAL")  # type: ignore
+        await self._conn.execute("PRAGMA temp_store=MEMORY")  # type: ignore
+
     async def _create_tables(self) -> None:
         """Create database tables and indexes if they don't exist."""
         async with self._lock:
@@ -123,12 +179,26 @@ class Database:
                     data TEXT NOT NULL,
                     created_at REAL NOT NULL,
                     last_accessed REAL NOT NULL,
-                    access_count INTEGER DEFAULT 1
+                    access_count INTEGER DEFAULT 1,
+                    expires_at REAL NOT NULL DEFAULT 0
                 )
             """
             )
 
-            # Index for cache cleanup
+            # Databases created before per-entry expiry lack the column; their
+            # rows get expires_at = 0 and are purged by the next cleanup
+            cursor = await self._conn.execute(  # type: ignore
+                "PRAGMA table_info(api_cache)"
+            )
+            columns = {row["name"] for row in await cursor.fetchall()}
+            if "expires_at" not in columns:
+                await self._conn.execute(  # type: ignore
+                    "ALTER TABLE api_cache "
+                    "ADD COLUMN expires_at REAL NOT NULL DEFAULT 0"
+                )
+                logger.info("Added expires_at column to api_cache")
+
+            # Index for LRU eviction
             await self._conn.execute(  # type: ignore
                 """
                 CREATE INDEX IF NOT EXISTS idx_cache_access 
@@ -136,6 +206,17 @@ class Database:
             """
             )
 
+            # Index for expired entry cleanup
+            await self._conn.execute(  # type: ignore
+                """
+                CREATE INDEX IF NOT EXISTS idx_cache_expires
+                ON api_cache(expires_at)
+            """
+            )
+            await self._conn.execute(  # type: ignore
+                "DROP INDEX IF EXISTS idx_cache_created"
+            )
+
             await self._conn.commit()  # type: ignore
             logger.info("Database tables initialized")
 
@@ -265,26 +346,53 @@ class Database:
 
     # ==================== API CACHE ====================
 
-    async def get_cache(self, cache_key: str, max_age: float) -> Optional[Any]:
+    async def get_cache(
+        self, cache_key: str, max_age: float, update_access: bool = True
+    ) -> Optional[Any]:
         """
         Retrieve cached data if it hasn't expired.
 
-        Updates the `last_accessed` timestamp and `access_count` on a hit.
-        Automatically deletes the entry if found but expired.
+        Updates the `last_accessed` timestamp and `access_count` on a hit,
+        unless `update_access` is False (callers that batch access updates
+        through `bulk_touch_cache`). Entries older than `max_age` are treated
+        as missing; they are deleted only once past their stored `expires_at`,
+        since other callers may accept older data for the same key.
 
         Args:
             cache_key: The unique cache identifier.
             max_age: Maximum allowed age of the cache entry in seconds.
+            update_access: Whether to record the hit immediately.
 
         Returns:
             The cached data (deserialized from JSON) or None if missing/expired.
         """
+        entry = await self.get_cache_entry(cache_key, max_age, update_access)
+        return entry[0] if entry is not None else None
+
+    async def get_cache_entry(
+        self, cache_key: str, max_age: float, update_access: bool = True
+    ) -> Optional[Tuple[Any, float]]:
+        """
+        Retrieve cached data together with its age.
+
+        Same semantics as `get_cache`, but also returns how old the entry is so
+        callers can serve slightly stale data while refreshing it.
+
+        Args:
+            cache_key: The unique cache identifier.
+            max_age: Maximum allowed age of the cache entry in seconds.
+            update_access: Whether to record the hit immediately.
+
+        Returns:
+            Tuple of (cached data, age in seconds) or None if missing/expired.
+        """
         try:
             async with self._lock:
                 current_time = time.time()
 
                 cursor = await self._conn.execute(  # type: ignore
-                    "SELECT data, created_at FROM api_cache WHERE cache_key = ?",
+                    "SELECT data, created_at, expires_at FROM api_cache "
+                    "WHERE cache_key = ?",
                     (cache_key,),
                 )
                 row = await cursor.fetchone()
@@ -294,22 +402,23 @@ class Database:
                     age = current_time - created_at
 
                     if age < max_age:
-                        # Update last accessed time and access count
-                        await self._conn.execute(  # type: ignore
-                            """
-                            UPDATE api_cache 
-                            SET last_accessed = ?, access_count = access_count + 1
-                            WHERE cache_key = ?
-                            """,
-                            (current_time, cache_key),
-                        )
-                        await self._conn.commit()  # type: ignore
-
-                        data = json.loads(row["data"])
+                        if update_access:
+                            # Update last accessed time and access count
+                            await self._conn.execute(  # type: ignore
+                                """
+                                UPDATE api_cache 
+                                SET last_accessed = ?, access_count = access_count + 1
+                                WHERE cache_key = ?
+                                """,
+                                (current_time, cache_key),
+                            )
+                            await self._conn.commit()  # type: ignore
+
+                        data = _decode_cache_data(row["data"])
                         logger.debug(f"Cache hit: {cache_key[:50]}...")
-                        return data
-                    else:
-                        # Expired - delete it
+                        return data, age
+                    elif row["expires_at"] <= current_time:
+                        # Past its retention - delete it
                         await self._conn.execute(  # type: ignore
                             "DELETE FROM api_cache WHERE cache_key = ?", (cache_key,)
                         )
@@ -322,7 +431,124 @@ class Database:
             logger.error(f"Error getting cache: {e}", exc_info=True)
             return None
 
-    async def set_cache(self, cache_key: str, data: Any, max_size: int) -> bool:
+    async def get_cache_entries_many(
+        self, cache_keys: List[str], max_age: float, update_access: bool = True
+    ) -> Dict[str, Tuple[Any, float]]:
+        """
+        Retrieve several cached entries, with their ages, in a single query.
+
+        Behaves like `get_cache` for each key: hits have their access
+        tracking updated (unless `update_access` is False) and entries past
+        their `expires_at` are deleted, but all keys share one SELECT and one
+        commit.
+
+        Args:
+            cache_keys: The unique cache identifiers to look up.
+            max_age: Maximum allowed age of a cache entry in seconds.
+            update_access: Whether to record the hits immediately.
+
+        Returns:
+            Dictionary mapping each found, unexpired key to a tuple of (cached
+            data, age in seconds). Missing or expired keys are omitted.
+        """
+        if not cache_keys:
+            return {}
+
+        try:
+            async with self._lock:
+                current_time = time.time()
+                placeholders = ", ".join("?" for _ in cache_keys)
+
+                cursor = await self._conn.execute(  # type: ignore
+                    f"SELECT cache_key, data, created_at, expires_at FROM api_cache "
+                    f"WHERE cache_key IN ({placeholders})",
+                    tuple(cache_keys),
+                )
+                rows = await cursor.fetchall()
+
+                results: Dict[str, Tuple[Any, float]] = {}
+                expired_keys = []
+
+                for row in rows:
+                    age = current_time - row["created_at"]
+                    if age < max_age:
+                        results[row["cache_key"]] = (
+                            _decode_cache_data(row["data"]),
+                            age,
+                        )
+                    elif row["expires_at"] <= current_time:
+                        expired_keys.append((row["cache_key"],))
+
+                if results and update_access:
+                    await self._conn.executemany(  # type: ignore
+                        """
+                        UPDATE api_cache 
+                        SET last_accessed = ?, access_count = access_count + 1
+                        WHERE cache_key = ?
+                        """,
+                        [(current_time, key) for key in results],
+                    )
+
+                if expired_keys:
+                    await self._conn.executemany(  # type: ignore
+                        "DELETE FROM api_cache WHERE cache_key = ?", expired_keys
+                    )
+
+                if (results and update_access) or expired_keys:
+                    await self._conn.commit()  # type: ignore
+
+                logger.debug(
+                    f"Cache batch lookup: {len(results)}/{len(cache_keys)} hits"
+                )
+                return results
+
+        except Exception as e:
+            logger.error(f"Error getting cache batch: {e}", exc_info=True)
+            return {}
+
+    async def bulk_touch_cache(
+        self, accesses: Dict[str, int], accessed_at: Optional[float] = None
+    ) -> bool:
+        """
+        Record buffered cache hits in a single transaction.
+
+        Lets callers keep access tracking in memory and flush it periodically,
+        so cache reads don't each turn into a write.
+
+        Args:
+            accesses: Mapping of cache key to the number of hits to record.
+            accessed_at: Timestamp to store as `last_accessed` (defaults to now).
+
+        Returns:
+            True if the update was successful, False otherwise.
+        """
+        if not accesses:
+            return True
+
+        try:
+            async with self._lock:
+                timestamp = accessed_at if accessed_at is not None else time.time()
+
+                await self._conn.executemany(  # type: ignore
+                    """
+                    UPDATE api_cache 
+                    SET last_accessed = ?, access_count = access_count + ?
+                    WHERE cache_key = ?
+                    """,
+                    [(timestamp, hits, key) for key, hits in accesses.items()],
+                )
+                await self._conn.commit()  # type: ignore
+
+                logger.debug(f"Recorded access for {len(accesses)} cache entries")
+                return True
+
+        except Exception as e:
+            logger.error(f"Error updating cache access: {e}", exc_info=True)
+            return False
+
+    async def set_cache(
+        self, cache_key: str, data: Any, max_size: int, ttl: float
+    ) -> bool:
         """
         Store data in cache with automatic size management (LRU).
 
@@ -333,6 +559,8 @@ class Database:
             cache_key: The unique cache identifier.
             data: Data to cache (must be JSON serializable).
             max_size: Maximum number of entries allowed in the cache table.
+            ttl: Seconds the row is kept before `cleanup_expired_cache` may
+                remove it.
 
         Returns:
             True if insertion/update was successful, False otherwise.
@@ -365,17 +593,25 @@ class Database:
                     logger.debug(f"Evicted {remove_count} old cache entries")
 
                 # Insert or replace cache entry
-                data_json = json.dumps(data)
+                data_json = _encode_cache_data(data)
                 await self._conn.execute(  # type: ignore
                     """
-                    INSERT INTO api_cache (cache_key, data, created_at, last_accessed)
-                    VALUES (?, ?, ?, ?)
+                    INSERT INTO api_cache
+                        (cache_key, data, created_at, last_accessed, expires_at)
+                    VALUES (?, ?, ?, ?, ?)
                     ON CONFLICT(cache_key) DO UPDATE SET
                         data = excluded.data,
                         created_at = excluded.created_at,
-                        last_accessed = excluded.last_accessed
+                        last_accessed = excluded.last_accessed,
+                        expires_at = excluded.expires_at
                     """,
-                    (cache_key, data_json, current_time, current_time),
+                    (
+                        cache_key,
+                        data_json,
+                        current_time,
+                        current_time,
+                        current_time + ttl,
+                    ),
                 )
                 await self._conn.commit()  # type: ignore
 
@@ -434,27 +670,23 @@ class Database:
             logger.error(f"Error getting cache stats: {e}", exc_info=True)
             return {"size": 0, "total_accesses": 0, "avg_accesses": 0}
 
-    async def cleanup_expired_cache(self, max_age: float) -> int:
+    async def cleanup_expired_cache(self) -> int:
         """
-        Remove expired cache entries based on creation time.
+        Remove cache entries past their stored expiry.
 
-        Args:
-            max_age: Maximum allowed age in seconds.
+        Runs as a single indexed DELETE over `expires_at`, so each entry lives
+        as long as its writer asked for (e.g., a day for the name list).
 
         Returns:
             Number of entries removed.
         """
         try:
             async with self._lock:
-                current_time = time.time()
-                cutoff_time = current_time - max_age
-
                 cursor = await self._conn.execute(  # type: ignore
-                    "DELETE FROM api_cache WHERE created_at < ? RETURNING cache_key",
-                    (cutoff_time,),
+                    "DELETE FROM api_cache WHERE expires_at < ?",
+                    (time.time(),),
                 )
-                deleted_rows = await cursor.fetchall()
-                deleted_count = len(deleted_rows)  # type: ignore
+                deleted_count = cursor.rowcount
 
                 await self._conn.commit()  # type: ignore
 